@@ -0,0 +1,33 @@
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "project")]
+
+from factory import GameFactory
+
+MONSTERS = 1_000_000
+
+def load_monsters():
+    with open(os.path.join(ROOT, "data", "monsters.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def build(raw_monsters, count, trusted):
+    create = GameFactory.create_monster
+    start = time.perf_counter()
+    for i in range(count):
+        create(raw_monsters[i % len(raw_monsters)], trusted=trusted)
+    return time.perf_counter() - start
+
+def main(count=MONSTERS):
+    raw_monsters = load_monsters()
+    validated = build(raw_monsters, count, trusted=False)
+    trusted = build(raw_monsters, count, trusted=True)
+    print(f"{count} mostri validati: {validated:.2f}s ({count / validated:,.0f}/s)")
+    print(f"{count} mostri fidati:   {trusted:.2f}s ({count / trusted:,.0f}/s)")
+    print(f"speedup: {validated / trusted:.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else MONSTERS)
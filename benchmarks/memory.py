@@ -0,0 +1,66 @@
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ENTITIES = 100_000
+BASELINE_REF = "cd1de1e"
+
+def load(root, name):
+    with open(os.path.join(root, "data", name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def bytes_per_entity(create, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    entities = [create() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del entities
+    return (after - before) / count
+
+def measure(root, count):
+    sys.path[:0] = [root, os.path.join(root, "project")]
+    from factory import GameFactory
+
+    warrior_data = next(d for d in load(root, "characters.json") if d["class"] == "Warrior")
+    goblin_data = next(d for d in load(root, "monsters.json") if d["class"] == "Goblin")
+    return {
+        "Warrior": bytes_per_entity(lambda: GameFactory.create_character(warrior_data), count),
+        "Goblin": bytes_per_entity(lambda: GameFactory.create_monster(goblin_data), count)
+    }
+
+def measure_baseline(ref, count):
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = subprocess.run(["git", "-C", ROOT, "archive", ref, "project", "data"], check=True, capture_output=True).stdout
+        subprocess.run(["tar", "-x", "-C", tmp], input=archive, check=True)
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), str(count), "--root", tmp, "--json"], check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("count", nargs="?", type=int, default=ENTITIES)
+    parser.add_argument("--baseline", default=BASELINE_REF, help="revisione git senza __slots__ da usare come riferimento")
+    parser.add_argument("--root", default=ROOT, help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    current = measure(args.root, args.count)
+    if args.json:
+        print(json.dumps(current))
+        return
+
+    baseline = measure_baseline(args.baseline, args.count)
+    print(f"{'':8} {args.baseline:>10} {'attuale':>10}")
+    for name, size in current.items():
+        print(f"{name + ':':8} {baseline[name]:>10.0f} {size:>10.0f} byte per istanza")
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,269 @@
+import json
 import os
+import threading
+from collections import OrderedDict
+
 import pygame
 
+from project.atlas import INDEX_NAME, TextureAtlas
+
+MANIFEST_NAME = "manifest.json"
+
+def variant_key(name: str, size: tuple[int, int], transform: str) -> str:
+    return f"{name}@{size[0]}x{size[1]}:{transform}"
+
+class BakedAssets:
+    def __init__(self, manifest_path: str, assets_dir: str | None = None):
+        self.manifest_path = manifest_path
+        self.assets_dir = os.path.normpath(assets_dir or os.path.dirname(os.path.dirname(manifest_path)))
+        self._variants = None
+
+    def _load_manifest(self):
+        if self._variants is None:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, "r", encoding="utf-8") as f:
+                    self._variants = json.load(f)["variants"]
+            else:
+                self._variants = {}
+        return self._variants
+
+    def __len__(self):
+        return len(self._load_manifest())
+
+    def path_for(self, path: str, size: tuple[int, int], transform: str) -> str | None:
+        relative = os.path.relpath(os.path.normpath(path), self.assets_dir)
+        if relative.startswith(".."):
+            return None
+        variant = self._load_manifest().get(variant_key(relative.replace(os.sep, "/"), size, transform))
+        if variant is None:
+            return None
+        return os.path.join(os.path.dirname(self.manifest_path), variant["file"])
+
+class SurfaceCache:
+    TRANSFORMS = ("scale", "smoothscale", "fit")
+    ROTATION_STEP = 5
+
+    def __init__(self, budget_bytes: int = 64 * 1024 * 1024, atlas: TextureAtlas | None = None,
+                 baked: BakedAssets | None = None):
+        if not isinstance(budget_bytes, int):
+            raise TypeError("Il budget di memoria deve essere un intero")
+        if budget_bytes <= 0:
+            raise ValueError("Il budget di memoria deve essere maggiore di 0")
+        self.budget_bytes = budget_bytes
+        self.atlas = atlas
+        self.baked = baked
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    @staticmethod
+    def surface_bytes(surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def decode(self, path: str, size: tuple[int, int] | None = None, transform: str = "scale"):
+        baked_path = self.baked.path_for(path, tuple(size), transform) if size and self.baked is not None else None
+        if baked_path is None and self.atlas is not None and path in self.atlas:
+            return None
+        return pygame.image.load(baked_path or path)
+
+    def get(self, path: str, size: tuple[int, int] | None = None, transform: str = "scale", decoded=None):
+        if transform not in self.TRANSFORMS:
+            raise ValueError(f"La trasformazione deve essere una tra: {self.TRANSFORMS}")
+        key = self.key(path, size, transform)
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return surface
+            self.misses += 1
+            image = self._entries.get((path, None, None))
+
+        baked_path = self.baked.path_for(path, key[1], transform) if size and self.baked is not None else None
+        if baked_path is not None:
+            surface = (decoded or pygame.image.load(baked_path)).convert_alpha()
+        else:
+            if image is None:
+                image = decoded.convert_alpha() if decoded is not None else self._load(path, native=not size)
+            surface = self.transform(image, key[1], transform) if size else image
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            self._store(key, surface)
+        return surface
+
+    def _load(self, path: str, native: bool = False):
+        if self.atlas is not None and path in self.atlas and (not native or self.atlas.is_native(path)):
+            return self.atlas.get(path)
+        return pygame.image.load(path).convert_alpha()
+
+    def get_rotated(self, path: str, size: tuple[int, int], angle: float, step: int = ROTATION_STEP):
+        if not isinstance(step, int) or step <= 0:
+            raise ValueError("Il passo di rotazione deve essere un intero maggiore di 0")
+        angle = round(angle / step) * step % 360
+        if angle == 0:
+            return self.get(path, size)
+
+        key = (path, tuple(size), "rotate", angle)
+        with self._lock:
+            surface = self._entries.get(key)
+            if surface is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return surface
+
+        surface = pygame.transform.rotate(self.get(path, size), angle)
+        with self._lock:
+            self.misses += 1
+            if key in self._entries:
+                return self._entries[key]
+            self._store(key, surface)
+        return surface
+
+    @staticmethod
+    def key(path: str, size: tuple[int, int] | None = None, transform: str = "scale"):
+        return path, tuple(size) if size else None, transform if size else None
+
+    @staticmethod
+    def transform(image, size, transform):
+        if transform == "scale":
+            return pygame.transform.scale(image, size)
+        if transform == "smoothscale":
+            return pygame.transform.smoothscale(image, size)
+        scale = min(size[0] / image.get_width(), size[1] / image.get_height())
+        return pygame.transform.smoothscale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+
+    def _store(self, key, surface):
+        self._entries[key] = surface
+        self.used_bytes += self.surface_bytes(surface)
+        self._evict()
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and len(self._entries) > 1:
+            _, surface = self._entries.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(surface)
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes: int) -> None:
+        if not isinstance(budget_bytes, int):
+            raise TypeError("Il budget di memoria deve essere un intero")
+        if budget_bytes <= 0:
+            raise ValueError("Il budget di memoria deve essere maggiore di 0")
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "used_bytes": self.used_bytes,
+            "budget_bytes": self.budget_bytes
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.used_bytes = 0
+
+class TextCache:
+    def __init__(self, max_entries: int = 512):
+        if not isinstance(max_entries, int):
+            raise TypeError("Il numero massimo di testi deve essere un intero")
+        if max_entries <= 0:
+            raise ValueError("Il numero massimo di testi deve essere maggiore di 0")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._fonts = {}
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def font(self, name: str | None, size: int):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, name: str | None, size: int, text: str, color: tuple[int, int, int] = (0, 0, 0)):
+        key = (name, size, text, tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(name, size).render(text, True, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surface
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "fonts": len(self._fonts)
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._fonts.clear()
+
 class AssetsManager:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+    atlas = TextureAtlas(os.path.join(BASE_DIR, "..", "assets", "atlas", INDEX_NAME))
+    baked = BakedAssets(os.path.join(BASE_DIR, "..", "assets", "baked", MANIFEST_NAME))
+    surfaces = SurfaceCache(atlas=atlas, baked=baked)
+    texts = TextCache()
 
     @staticmethod
     def asset_path(*args):
         return os.path.join(AssetsManager.BASE_DIR, *args)
 
+    @staticmethod
+    def get_surface(path, size=None, transform="scale", decoded=None):
+        return AssetsManager.surfaces.get(path, size, transform, decoded)
+
+    @staticmethod
+    def decode_surface(path, size=None, transform="scale"):
+        return AssetsManager.surfaces.decode(path, size, transform)
+
+    @staticmethod
+    def get_rotated(path, size, angle):
+        return AssetsManager.surfaces.get_rotated(path, size, angle)
+
+    @staticmethod
+    def get_font(name, size):
+        return AssetsManager.texts.font(name, size)
+
+    @staticmethod
+    def render_text(name, size, text, color=(0, 0, 0)):
+        return AssetsManager.texts.render(name, size, text, color)
+
     @staticmethod
     def load_image(folder, filename, scale=None):
         path = AssetsManager.asset_path("..", "assets", folder, filename)
         try:
-            image = pygame.image.load(path).convert_alpha()
-            if scale:
-                image = pygame.transform.scale(image, scale)
-            return image
+            return AssetsManager.get_surface(path, scale)
         except pygame.error:
             print(f"Errore: Impossibile trovare {path}")
             return pygame.Surface((32, 32))
@@ -28,4 +276,4 @@ class AssetsManager:
             "walk_1": AssetsManager.asset_path("..", "assets", folder, f"{folder}_2.png"),
             "walk_2": AssetsManager.asset_path("..", "assets", folder, f"{folder}_3.png"),
             "attack": AssetsManager.asset_path("..", "assets", folder, f"{folder}_4.png")
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+
+import pygame
+
+ATLAS_FOLDERS = (
+    "buttons", "cleric", "effect", "goblin", "potions", "projectile",
+    "thief", "troll", "warrior", "weapon", "wizard"
+)
+ATLAS_FILES = ("wooden_board.png",)
+INDEX_NAME = "atlas.json"
+
+def _shelf_pack(sizes: list[tuple[int, int]], page_size: int) -> list[tuple[int, int, int, int, int]]:
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    placements = [None] * len(sizes)
+    page, x, y, shelf_height = 0, 0, 0, 0
+    for i in order:
+        w, h = sizes[i]
+        if w > page_size or h > page_size:
+            raise ValueError(f"L'immagine {w}x{h} non entra in una pagina di {page_size}px")
+        if x + w > page_size:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + h > page_size:
+            page, x, y, shelf_height = page + 1, 0, 0, 0
+        placements[i] = (page, x, y, w, h)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return placements
+
+def _sources(assets_dir: str) -> list[str]:
+    names = [name for name in ATLAS_FILES if os.path.exists(os.path.join(assets_dir, name))]
+    for folder in ATLAS_FOLDERS:
+        path = os.path.join(assets_dir, folder)
+        if os.path.isdir(path):
+            names.extend(f"{folder}/{name}" for name in sorted(os.listdir(path)) if name.endswith(".png"))
+    return names
+
+def build_atlas(assets_dir: str, output_dir: str, max_size: int = 300, page_size: int = 2048) -> dict:
+    if max_size <= 0 or page_size <= 0:
+        raise ValueError("Le dimensioni dell'atlante devono essere maggiori di 0")
+
+    names = _sources(assets_dir)
+    images = []
+    native_sizes = []
+    for name in names:
+        image = pygame.image.load(os.path.join(assets_dir, name)).convert_alpha()
+        native_sizes.append(image.get_size())
+        scale = min(1.0, max_size / max(image.get_size()))
+        if scale < 1.0:
+            size = (max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale)))
+            image = pygame.transform.smoothscale(image, size)
+        images.append(image)
+
+    placements = _shelf_pack([image.get_size() for image in images], page_size)
+    heights = {}
+    for page, _, y, _, h in placements:
+        heights[page] = max(heights.get(page, 0), y + h)
+    pages = [pygame.Surface((page_size, heights[i]), pygame.SRCALPHA) for i in range(len(heights))]
+
+    regions = {}
+    for name, image, native_size, (page, x, y, w, h) in zip(names, images, native_sizes, placements):
+        pages[page].blit(image, (x, y))
+        regions[name] = {"page": page, "rect": [x, y, w, h], "size": list(native_size)}
+
+    os.makedirs(output_dir, exist_ok=True)
+    page_names = []
+    for i, page in enumerate(pages):
+        page_name = f"atlas_{i}.png"
+        pygame.image.save(page, os.path.join(output_dir, page_name))
+        page_names.append(page_name)
+
+    index = {"pages": page_names, "regions": regions}
+    with open(os.path.join(output_dir, INDEX_NAME), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    return index
+
+class TextureAtlas:
+    def __init__(self, index_path: str, assets_dir: str | None = None):
+        self.index_path = index_path
+        self.assets_dir = os.path.normpath(assets_dir or os.path.dirname(os.path.dirname(index_path)))
+        self._regions = None
+        self._pages = None
+
+    def _load_index(self):
+        if self._regions is None:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                self._page_names = index["pages"]
+                self._regions = index["regions"]
+            else:
+                self._page_names = []
+                self._regions = {}
+        return self._regions
+
+    def _load_pages(self):
+        if self._pages is None:
+            folder = os.path.dirname(self.index_path)
+            self._pages = [pygame.image.load(os.path.join(folder, name)).convert_alpha() for name in self._page_names]
+        return self._pages
+
+    def region_name(self, path: str) -> str | None:
+        relative = os.path.relpath(os.path.normpath(path), self.assets_dir)
+        if relative.startswith(".."):
+            return None
+        return relative.replace(os.sep, "/")
+
+    def __contains__(self, path: str) -> bool:
+        name = self.region_name(path)
+        return name is not None and name in self._load_index()
+
+    def __len__(self):
+        return len(self._load_index())
+
+    def is_native(self, path: str) -> bool:
+        region = self._load_index().get(self.region_name(path))
+        return region is not None and region.get("size") == region["rect"][2:]
+
+    def get(self, path: str):
+        name = self.region_name(path)
+        region = self._load_index().get(name) if name else None
+        if region is None:
+            raise KeyError(f"Nessuna regione dell'atlante per {path}")
+        return self._load_pages()[region["page"]].subsurface(region["rect"])
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    assets = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    result = build_atlas(assets, os.path.join(assets, "atlas"), *(int(arg) for arg in sys.argv[1:3]))
+    print(f"{len(result['regions'])} immagini in {len(result['pages'])} pagine")
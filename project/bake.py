@@ -0,0 +1,95 @@
+import hashlib
+import json
+import os
+
+import pygame
+
+from project.assets_manager import MANIFEST_NAME, SurfaceCache, variant_key
+from project.view import BaseSprite, CharacterCard, EffectSprite, InventoryCard, ProjectileSprite, UIManager
+
+SCREEN_SIZE = (800, 600)
+ITEM_FOLDERS = ("weapon", "armor", "potions")
+
+def _pngs(assets_dir: str, folder: str) -> list[str]:
+    path = os.path.join(assets_dir, folder)
+    if not os.path.isdir(path):
+        return []
+    return [f"{folder}/{name}" for name in sorted(os.listdir(path)) if name.endswith(".png")]
+
+def runtime_variants(assets_dir: str, screen_size: tuple[int, int] = SCREEN_SIZE) -> list[tuple[str, tuple[int, int], str]]:
+    variants = []
+    for folder in sorted(os.listdir(assets_dir)):
+        if not os.path.exists(os.path.join(assets_dir, folder, f"{folder}_1.png")):
+            continue
+        scale = next((s for name, s in BaseSprite.SIZE_SCALES.items() if name.lower() == folder), 1)
+        size = (int(BaseSprite.SIZE_X * scale), int(BaseSprite.SIZE_Y * scale))
+        variants.extend((name, size, "scale") for name in _pngs(assets_dir, folder))
+        variants.append((f"{folder}/{folder}_1.png", CharacterCard.content_size(), "fit"))
+
+    for folder in ITEM_FOLDERS:
+        variants.extend((name, InventoryCard.item_size(), "fit") for name in _pngs(assets_dir, folder))
+    variants.extend((name, (ProjectileSprite.SIZE_X, ProjectileSprite.SIZE_Y), "scale") for name in _pngs(assets_dir, "projectile"))
+    variants.extend((name, (EffectSprite.SIZE_X, EffectSprite.SIZE_Y), "scale") for name in _pngs(assets_dir, "effect"))
+    variants.extend((name, UIManager.BUTTON_SIZE, "scale") for name in _pngs(assets_dir, "buttons"))
+    variants.extend((name, screen_size, "scale") for name in _pngs(assets_dir, "bg"))
+    variants.append(("menu_wooden_board.jpg", screen_size, "scale"))
+    for card in (CharacterCard, InventoryCard):
+        variants.append(("wooden_board.png", (card.WIDTH, card.HEIGHT), "smoothscale"))
+    return variants
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def bake(assets_dir: str, output_dir: str, screen_size: tuple[int, int] = SCREEN_SIZE) -> dict[str, int]:
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = json.load(f)["variants"]
+
+    hashes = {}
+    variants = {}
+    counts = {"baked": 0, "skipped": 0, "removed": 0}
+    for name, size, transform in runtime_variants(assets_dir, screen_size):
+        source = os.path.join(assets_dir, name)
+        if not os.path.exists(source):
+            continue
+        if name not in hashes:
+            hashes[name] = file_hash(source)
+        key = variant_key(name, size, transform)
+        stem = os.path.splitext(name)[0]
+        entry = {"file": f"{stem}_{size[0]}x{size[1]}_{transform}.png", "source_hash": hashes[name]}
+
+        old = previous.get(key)
+        if old == entry and os.path.exists(os.path.join(output_dir, entry["file"])):
+            counts["skipped"] += 1
+        else:
+            image = pygame.image.load(source).convert_alpha()
+            target = os.path.join(output_dir, entry["file"])
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            pygame.image.save(SurfaceCache.transform(image, size, transform), target)
+            counts["baked"] += 1
+        variants[key] = entry
+
+    for key, entry in previous.items():
+        stale = os.path.join(output_dir, entry["file"])
+        if key not in variants and os.path.exists(stale):
+            os.remove(stale)
+            counts["removed"] += 1
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"variants": variants}, f, indent=2, sort_keys=True)
+    return counts
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    assets = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    result = bake(assets, os.path.join(assets, "baked"))
+    print(f"{result['baked']} varianti generate, {result['skipped']} invariate, {result['removed']} rimosse")
@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from characters import Character, Warrior, Cleric, Thief, Wizard
+from monsters import Monster, Goblin, Zombie, Troll, Witch, Spider
+from rng import BattleRng, UNIT, GOLDEN, STREAM_MULTIPLIER, STREAM_INCREMENT
+
+STAT_NAMES = ("strength", "intelligence", "defense", "dexterity")
+
+HERO_CLASSES = (Warrior, Cleric, Thief, Wizard)
+
+HERO_WINS = 1
+MONSTER_WINS = -1
+NO_WINNER = 0
+
+def splitmix64(z: np.ndarray) -> np.ndarray:
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+@dataclass
+class BatchResult:
+    winner: np.ndarray
+    rounds: np.ndarray
+    hero_hp: np.ndarray
+    monster_hp: np.ndarray
+
+    def __len__(self):
+        return len(self.winner)
+
+    @property
+    def win_rate(self) -> float:
+        if len(self.winner) == 0:
+            return 0.0
+        return float(np.count_nonzero(self.winner == HERO_WINS)) / len(self.winner)
+
+    @property
+    def mean_rounds(self) -> float:
+        if len(self.rounds) == 0:
+            return 0.0
+        return float(self.rounds.mean())
+
+class BatchBattle:
+    def __init__(self, heroes: list[Character], monsters: list[Monster], seed: int | str | None = None, max_rounds: int = 500, use_special_ability: bool = True, rng: BattleRng | None = None):
+        if not isinstance(heroes, list) or not isinstance(monsters, list):
+            raise TypeError("Eroi e mostri devono essere rappresentati da liste")
+        if len(heroes) != len(monsters):
+            raise ValueError("Il numero di eroi deve essere uguale al numero di mostri")
+        for hero in heroes:
+            if not isinstance(hero, HERO_CLASSES):
+                raise TypeError("Gli eroi devono essere istanze di Warrior, Cleric, Thief o Wizard")
+        for monster in monsters:
+            if not isinstance(monster, Monster):
+                raise TypeError("I mostri devono essere istanze di Monster o di una sua sottoclasse")
+            if isinstance(monster, (Witch, Spider)):
+                raise TypeError("Il motore batch non supporta i mostri con veleni (Witch, Spider)")
+        if not isinstance(max_rounds, int):
+            raise TypeError("Il numero massimo di round deve essere un intero")
+        if max_rounds <= 0:
+            raise ValueError("Il numero massimo di round deve essere maggiore di 0")
+
+        self.max_rounds = max_rounds
+        self.use_special_ability = use_special_ability
+        self.rng = rng or BattleRng(seed)
+        self.round = 0
+        self._states = None
+
+        self._load_heroes(heroes)
+        self._load_monsters(monsters)
+
+        size = len(heroes)
+        self.done = np.zeros(size, dtype=bool)
+        self.winner = np.full(size, NO_WINNER, dtype=np.int8)
+        self.rounds = np.zeros(size, dtype=np.int64)
+
+    @classmethod
+    def repeat(cls, hero: Character, monster: Monster, battles: int, **kwargs) -> "BatchBattle":
+        if not isinstance(battles, int):
+            raise TypeError("Il numero di battaglie deve essere un intero")
+        if battles < 0:
+            raise ValueError("Il numero di battaglie non può essere negativo")
+        batch = cls([hero], [monster], **kwargs)
+        for name, column in vars(batch).items():
+            if isinstance(column, np.ndarray):
+                setattr(batch, name, np.repeat(column, battles))
+        return batch
+
+    def _load_heroes(self, heroes):
+        stats = np.array([[getattr(h.base_stats, name) for name in STAT_NAMES] for h in heroes], dtype=np.float64).reshape(-1, 4)
+        self.strength, self.intelligence, self.defense, self.dexterity = (stats[:, i].copy() for i in range(4))
+
+        weights = np.array([h.ATTACK_WEIGHTS for h in heroes], dtype=np.float64).reshape(-1, 3)
+        self.weight_strength, self.weight_dexterity, self.weight_intelligence = (weights[:, i].copy() for i in range(3))
+
+        self.hero_hp = np.array([h.hp for h in heroes], dtype=np.int64)
+        self.hero_max_hp = np.array([h.max_hp for h in heroes], dtype=np.int64)
+        self.mana = np.array([h.mana for h in heroes], dtype=np.int64)
+        self.mana_per_attack = np.array([h.mana_per_attack for h in heroes], dtype=np.int64)
+        self.spends_mana = np.array([not isinstance(h, Wizard) for h in heroes], dtype=bool)
+        self.shield = np.array([h.shield if isinstance(h, Warrior) else 0 for h in heroes], dtype=np.int64)
+        self.is_thief = np.array([isinstance(h, Thief) for h in heroes], dtype=bool)
+        self.critical_bonus = np.array([h.critical_bonus if isinstance(h, Thief) else 0 for h in heroes], dtype=np.int64)
+        self.healing_per_attack = np.array([h.healing_per_attack if isinstance(h, Cleric) else 0 for h in heroes], dtype=np.int64)
+
+        self.buff_stat = np.array([STAT_NAMES.index(h.special_ability.stat) for h in heroes], dtype=np.int8)
+        self.buff_amount = np.array([h.special_ability.amount for h in heroes], dtype=np.float64)
+        self.buff_duration = np.array([h.special_ability.duration for h in heroes], dtype=np.int64)
+
+    def _load_monsters(self, monsters):
+        self.monster_hp = np.array([m.hp for m in monsters], dtype=np.int64)
+        self.monster_max_hp = np.array([m.max_hp for m in monsters], dtype=np.int64)
+        self.base_damage = np.array([m.base_damage for m in monsters], dtype=np.int64)
+        self.bonus_damage = np.array([m.bonus_damage for m in monsters], dtype=np.int64)
+        self.is_goblin = np.array([isinstance(m, Goblin) for m in monsters], dtype=bool)
+        self.is_troll = np.array([isinstance(m, Troll) for m in monsters], dtype=bool)
+        self.brute_force = np.array([m.brute_force if isinstance(m, Troll) else 0 for m in monsters], dtype=np.int64)
+        self.can_revive = np.array([isinstance(m, Zombie) and m.can_revive for m in monsters], dtype=bool)
+        self.revive_hp = np.array([m.initial_hp if isinstance(m, Zombie) else 0 for m in monsters], dtype=np.int64)
+
+    def _draw(self, mask, high):
+        if self._states is None:
+            index = np.arange(1, len(self.done) + 1, dtype=np.uint64)
+            self._states = splitmix64(np.uint64(self.rng.stream_key) + index * np.uint64(GOLDEN))
+        states = self._states[mask] * np.uint64(STREAM_MULTIPLIER) + np.uint64(STREAM_INCREMENT)
+        self._states[mask] = states
+        values = np.zeros(len(self.done), dtype=np.int64)
+        values[mask] = ((states >> np.uint64(11)) * UNIT * high).astype(np.int64)
+        return values
+
+    def _buffed(self, stat_index, column):
+        if not self.use_special_ability:
+            return column
+        active = (self.round >= 2) & (self.round <= self.buff_duration) & (self.buff_stat == stat_index)
+        return column + np.where(active, self.buff_amount, 0.0)
+
+    def step(self) -> None:
+        if self.round >= self.max_rounds or self.done.all():
+            return
+        self.round += 1
+        active = ~self.done
+
+        strength = self._buffed(0, self.strength)
+        intelligence = self._buffed(1, self.intelligence)
+        defense = self._buffed(2, self.defense)
+        dexterity = self._buffed(3, self.dexterity)
+
+        attacks = active & (self.mana >= self.mana_per_attack)
+        if self.use_special_ability and self.round == 1:
+            attacks[:] = False
+
+        damage = np.trunc(
+            (strength * self.weight_strength) + (dexterity * self.weight_dexterity) + (intelligence * self.weight_intelligence)
+        ).astype(np.int64)
+        damage += self.critical_bonus * self._draw(attacks & self.is_thief, 2)
+
+        self.monster_hp = np.where(attacks, np.maximum(0, self.monster_hp - damage), self.monster_hp)
+        revived = attacks & self.can_revive & (self.monster_hp == 0)
+        self.monster_hp = np.where(revived, self.revive_hp, self.monster_hp)
+        self.can_revive &= ~revived
+
+        self.mana -= np.where(attacks & self.spends_mana, self.mana_per_attack, 0)
+        heals = attacks & (self.healing_per_attack > 0)
+        self.hero_hp = np.where(heals, np.minimum(self.hero_max_hp, self.hero_hp + self.healing_per_attack), self.hero_hp)
+
+        monster_dead = active & (self.monster_hp <= 0)
+        self._finish(monster_dead, HERO_WINS)
+        active &= ~monster_dead
+
+        coin = self._draw(active & ~self.is_troll, 2)
+        extra = self._draw(active & self.is_goblin, 101) < 20
+        monster_damage = self.base_damage + np.where(self.is_troll, 0, self.bonus_damage * coin)
+        monster_damage += np.where(self.is_goblin & extra, self.bonus_damage, 0)
+        monster_damage += np.where(self.is_troll & (self.monster_hp < self.monster_max_hp // 2), self.brute_force, 0)
+
+        received = np.trunc(self.hero_hp - (monster_damage - (defense * 0.3) - self.shield)).astype(np.int64)
+        self.hero_hp = np.where(active, np.maximum(0, received), self.hero_hp)
+
+        hero_dead = active & (self.hero_hp <= 0)
+        self._finish(hero_dead, MONSTER_WINS)
+
+        if self.round >= self.max_rounds:
+            self._finish(~self.done, NO_WINNER)
+
+    def _finish(self, mask, winner):
+        self.winner[mask] = winner
+        self.rounds[mask] = self.round
+        self.done |= mask
+
+    def run(self) -> BatchResult:
+        while self.round < self.max_rounds and not self.done.all():
+            self.step()
+        return BatchResult(self.winner.copy(), self.rounds.copy(), self.hero_hp.copy(), self.monster_hp.copy())
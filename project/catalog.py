@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+class Catalog:
+    def __init__(self, characters: list[dict], weapons: list[dict], projectiles: list[dict],
+                 monsters: list[dict], potions: list[dict]):
+        self.characters = self._index(characters, "personaggio")
+        self.weapons = self._index(weapons, "arma")
+        self.monsters = self._index(monsters, "mostro")
+        self.potions = self._index(potions, "pozione")
+        self.monster_list = list(self.monsters.values())
+
+        self.monsters_by_class = self._group(monsters, "class")
+        self.weapons_by_type = self._group(weapons, "weapon_type")
+        self.weapons_by_slot = self._group(weapons, "slot")
+
+        self.projectiles = {}
+        for p in projectiles:
+            if p["weapon"] in self.projectiles:
+                raise ValueError(f"Proiettile duplicato per l'arma {p['weapon']}")
+            self.projectiles[p["weapon"]] = {
+                "name": p["projectile_type"],
+                "speed": p["speed"],
+                "effect": p["effect"]
+            }
+
+    @classmethod
+    def from_catalogs(cls, catalogs: dict[str, list[dict]]) -> "Catalog":
+        return cls(catalogs["characters"], catalogs["weapons"], catalogs["projectiles"],
+                   catalogs["monsters"], catalogs["potions"])
+
+    @staticmethod
+    def _index(records, kind):
+        index = {}
+        for record in records:
+            if record["name"] in index:
+                raise ValueError(f"Nome duplicato per {kind}: {record['name']}")
+            index[record["name"]] = record
+        return index
+
+    @staticmethod
+    def _group(records, field):
+        groups = defaultdict(list)
+        for record in records:
+            groups[record[field]].append(record)
+        return dict(groups)
+
+    @staticmethod
+    def _get(index, name, message):
+        record = index.get(name)
+        if record is None:
+            raise KeyError(f"{message}: {name}")
+        return record
+
+    def character(self, name: str) -> dict:
+        return self._get(self.characters, name, "Personaggio sconosciuto")
+
+    def weapon(self, name: str) -> dict:
+        return self._get(self.weapons, name, "Arma sconosciuta")
+
+    def monster(self, name: str) -> dict:
+        return self._get(self.monsters, name, "Mostro sconosciuto")
+
+    def potion(self, name: str) -> dict:
+        return self._get(self.potions, name, "Pozione sconosciuta")
+
+    def projectile_for(self, weapon_name: str) -> dict | None:
+        return self.projectiles.get(weapon_name)
+
+    def monsters_of_class(self, class_name: str) -> list[dict]:
+        return self.monsters_by_class.get(class_name, [])
+
+    def weapons_of_type(self, weapon_type: str) -> list[dict]:
+        return self.weapons_by_type.get(weapon_type, [])
+
+    def weapons_in_slot(self, slot: str) -> list[dict]:
+        return self.weapons_by_slot.get(slot, [])
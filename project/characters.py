@@ -1,64 +1,75 @@
 from abc import ABC, abstractmethod
-from random import randint
 
 from datatypes import Stats, Buff, Poison
 from errors import InvalidEquipError
 from items import Item
 from potions import Potion
+from rng import BattleRng, default_rng
+from scheduler import ExpiryScheduler
 from valid_slot import CHARACTER_SLOTS
 
 class Character(ABC):
-    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], speed: int):
-        if not isinstance(name, str):
-            raise TypeError("Il nome deve essere una stringa")
-        if name == "":
-            raise ValueError("Il nome non può essere una stringa vuota")
-        if not isinstance(hp, int):
-            raise TypeError("La vita deve essere rappresentata da un intero")
-        if hp <= 0:
-            raise TypeError("La vita deve essere inizializzata maggiore di 0")
-        if not isinstance(base_stats, Stats):
-            raise TypeError("Le statistiche base devono essere un'istanza di Stats")
-        if not isinstance(equipment, dict):
-            raise TypeError("L'equipaggiamento deve essere un dizionario")
-        for k, v in equipment.items():
-            if k not in CHARACTER_SLOTS:
-                raise ValueError(f"Gli oggetti possono essere equipaggiati solo in questi slot: {CHARACTER_SLOTS}")
-            if not isinstance(v, Item) and v is not None:
-                raise ValueError("Gli unici oggetti validi da poter equipaggiare sono le istanze di Item o le sue sottoclassi")
-        if not isinstance(mana, int):
-           raise TypeError("Il mana deve essere rappresentato da un intero")
-        if mana <= 0:
-            raise ValueError("Il mana deve essere inizializzato maggiore di 0")
-        if not isinstance(mana_per_attack, int):
-            raise TypeError("Il mana consumato per ogni attacco deve essere un intero")
-        if mana_per_attack <= 0:
-            raise ValueError("Il mana consumato per ogni attacco deve essere maggiore di 0")
-        if not isinstance(special_ability, Buff):
-            raise TypeError("L'abilità speciale deve essere un'istanza di buff")
-        if not isinstance(potions_set, list):
-            raise TypeError("Il set di pozioni deve essere rappresentato da una lista")
-        for element in potions_set:
-            if not isinstance(element, Potion):
-                raise TypeError("Il set di pozioni deve essere composto da sottoclassi di Potion")
-        if not isinstance(speed, int):
-            raise TypeError("La velocità deve essere rappresentata da un intero")
-        if speed <= 0:
-            raise ValueError("La velocità deve essere maggiore di 0")
+    __slots__ = ("__name", "__hp", "__base_stats", "__equipment", "__mana", "__max_mana", "__max_hp", "__buffs", "__pending_buffs", "__special_ability", "__mana_per_attack", "__special_ability_used", "__potions_set", "__poisons", "__speed", "__attack_power", "__damage_mitigation", "__stats_version")
+
+    ATTACK_WEIGHTS = (0.0, 0.0, 0.0)
+
+    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], speed: int, validate: bool = True):
+        if validate:
+            if not isinstance(name, str):
+                raise TypeError("Il nome deve essere una stringa")
+            if name == "":
+                raise ValueError("Il nome non può essere una stringa vuota")
+            if not isinstance(hp, int):
+                raise TypeError("La vita deve essere rappresentata da un intero")
+            if hp <= 0:
+                raise TypeError("La vita deve essere inizializzata maggiore di 0")
+            if not isinstance(base_stats, Stats):
+                raise TypeError("Le statistiche base devono essere un'istanza di Stats")
+            if not isinstance(equipment, dict):
+                raise TypeError("L'equipaggiamento deve essere un dizionario")
+            for k, v in equipment.items():
+                if k not in CHARACTER_SLOTS:
+                    raise ValueError(f"Gli oggetti possono essere equipaggiati solo in questi slot: {CHARACTER_SLOTS}")
+                if not isinstance(v, Item) and v is not None:
+                    raise ValueError("Gli unici oggetti validi da poter equipaggiare sono le istanze di Item o le sue sottoclassi")
+            if not isinstance(mana, int):
+                raise TypeError("Il mana deve essere rappresentato da un intero")
+            if mana <= 0:
+                raise ValueError("Il mana deve essere inizializzato maggiore di 0")
+            if not isinstance(mana_per_attack, int):
+                raise TypeError("Il mana consumato per ogni attacco deve essere un intero")
+            if mana_per_attack <= 0:
+                raise ValueError("Il mana consumato per ogni attacco deve essere maggiore di 0")
+            if not isinstance(special_ability, Buff):
+                raise TypeError("L'abilità speciale deve essere un'istanza di buff")
+            if not isinstance(potions_set, list):
+                raise TypeError("Il set di pozioni deve essere rappresentato da una lista")
+            for element in potions_set:
+                if not isinstance(element, Potion):
+                    raise TypeError("Il set di pozioni deve essere composto da sottoclassi di Potion")
+            if not isinstance(speed, int):
+                raise TypeError("La velocità deve essere rappresentata da un intero")
+            if speed <= 0:
+                raise ValueError("La velocità deve essere maggiore di 0")
 
         self.__name = name
         self.__hp = hp
         self.__base_stats = base_stats
         self.__equipment = equipment
         self.__mana = mana
+        self.__max_mana = mana
         self.__max_hp = hp
-        self.active_buffs = []
+        self.__buffs = None
+        self.__pending_buffs = None
         self.__special_ability = special_ability
         self.__mana_per_attack = mana_per_attack
         self.__special_ability_used = False
         self.__potions_set = potions_set
-        self.active_poisons = []
+        self.__poisons = None
         self.__speed = speed
+        self.__attack_power = None
+        self.__damage_mitigation = None
+        self.__stats_version = base_stats.version
 
     @property
     def name(self):
@@ -76,6 +87,14 @@ class Character(ABC):
             raise ValueError("La vita non può essere negativa")
         self.__hp = value
 
+    @property
+    def active_buffs(self) -> list[Buff]:
+        return list(self.__buffs or ())
+
+    @property
+    def active_poisons(self) -> list[Poison]:
+        return list(self.__poisons or ())
+
     @property
     def special_ability(self):
         return self.__special_ability
@@ -89,6 +108,30 @@ class Character(ABC):
         if not isinstance(value, Stats):
             raise TypeError("Le statistiche base devono essere un'istanza di Stats")
         self.__base_stats = value
+        self.invalidate_stats()
+
+    @property
+    def attack_power(self) -> int:
+        stats = self.__base_stats
+        if self.__stats_version != stats.version:
+            self.invalidate_stats()
+        if self.__attack_power is None:
+            strength_weight, dexterity_weight, intelligence_weight = self.ATTACK_WEIGHTS
+            self.__attack_power = int((stats.strength * strength_weight) + (stats.dexterity * dexterity_weight) + (stats.intelligence * intelligence_weight))
+        return self.__attack_power
+
+    @property
+    def damage_mitigation(self) -> float:
+        if self.__stats_version != self.__base_stats.version:
+            self.invalidate_stats()
+        if self.__damage_mitigation is None:
+            self.__damage_mitigation = self.__base_stats.defense * 0.3
+        return self.__damage_mitigation
+
+    def invalidate_stats(self) -> None:
+        self.__attack_power = None
+        self.__damage_mitigation = None
+        self.__stats_version = self.__base_stats.version
 
     @property
     def used_special_ability(self):
@@ -143,6 +186,7 @@ class Character(ABC):
             raise InvalidEquipError
         self.__equipment[item.slot] = item
         self.__base_stats = self.base_stats + item.bonus_stats
+        self.invalidate_stats()
 
     def unequip(self, item: Item) -> None:
         if not isinstance(item, Item):
@@ -151,13 +195,14 @@ class Character(ABC):
             raise ValueError("L'oggetto da disequipaggiare non è nell'quipaggiamento del personaggio")
         self.__equipment[item.slot] = None
         self.__base_stats = self.base_stats - item.bonus_stats
+        self.invalidate_stats()
 
     def receive_damage(self, damage: int) -> None:
         if not isinstance(damage, int):
             raise TypeError("Il danno deve essere un intero")
         if damage < 0:
             raise ValueError("Il danno deve essere maggiore di 0")
-        self.hp = max(0, int(self.hp - (damage - (self.base_stats.defense * 0.3))))
+        self.__hp = max(0, int(self.__hp - (damage - self.damage_mitigation)))
 
     def is_alive(self) -> bool:
         if self.__hp > 0:
@@ -182,11 +227,29 @@ class Character(ABC):
     def add_buff(self, buff: Buff) -> None:
         if not isinstance(buff, Buff):
             raise TypeError("Un buff deve essere un'istanza di Buff")
-        self.active_buffs.append(buff)
+        if self.__buffs is None:
+            self.__buffs = ExpiryScheduler()
+            self.__pending_buffs = []
+        self.__buffs.schedule(buff, buff.duration)
+        self.__pending_buffs.append(buff)
+
+    def extend_buff(self, buff: Buff, rounds: int) -> None:
+        if not isinstance(rounds, int):
+            raise TypeError("I round aggiuntivi devono essere rappresentati da un intero")
+        if self.__buffs is None:
+            raise ValueError("Il buff non è attivo sul personaggio")
+        self.__buffs.extend(buff, rounds)
+
+    def buff_rounds_left(self, buff: Buff) -> int:
+        if self.__buffs is None:
+            raise ValueError("Il buff non è attivo sul personaggio")
+        return self.__buffs.remaining(buff)
 
     def apply_buffs(self, buffs):
+        if self.__buffs is None:
+            return
         for buff in buffs:
-            if not buff.applied:
+            if not buff.applied and buff in self.__buffs:
                 setattr(
                     self.base_stats,
                     buff.stat,
@@ -194,20 +257,36 @@ class Character(ABC):
                 )
                 buff.applied = True
 
+    def remove_buff(self, buff: Buff) -> None:
+        if self.__buffs is None or buff not in self.__buffs:
+            raise ValueError("Il buff non è attivo sul personaggio")
+        self.__buffs.cancel(buff)
+        self.__revert_buff(buff)
+
     def remove_buffs(self):
-        for buff in self.active_buffs[:]:
-            if buff.duration <= 0:
-                setattr(
-                    self.base_stats,
-                    buff.stat,
-                    getattr(self.base_stats, buff.stat) - buff.amount
-                )
-                self.active_buffs.remove(buff)
+        buffs = self.__buffs
+        if buffs is None:
+            return
+        for buff in buffs.advance():
+            self.__revert_buff(buff)
+        if not buffs:
+            self.__buffs = None
+
+    def __revert_buff(self, buff: Buff) -> None:
+        if buff.applied:
+            setattr(
+                self.base_stats,
+                buff.stat,
+                getattr(self.base_stats, buff.stat) - buff.amount
+            )
+            buff.applied = False
 
     def add_poison(self, poison: Poison):
         if not isinstance(poison, Poison):
             raise TypeError("Un veleno deve essere un'istanza di Poison")
-        self.active_poisons.append(poison)
+        if self.__poisons is None:
+            self.__poisons = ExpiryScheduler()
+        self.__poisons.schedule(poison, poison.duration)
 
     def apply_poisons(self, poisons: list[Poison]):
         if not isinstance(poisons, list):
@@ -224,23 +303,14 @@ class Character(ABC):
         for element in poisons:
             if not isinstance(element, Poison):
                 raise TypeError("Tutti i veleni devono essere un'istanza di Poison")
+        if self.__poisons is None:
+            return
         for poison in poisons:
-            if poison.duration == 0:
-                self.active_poisons.remove(poison)
+            self.__poisons.cancel(poison)
 
     def use_special_ability(self):
         self.add_buff(self.__special_ability)
 
-    @staticmethod
-    def tick_buffs(buffs: list[Buff]):
-        if not isinstance(buffs, list):
-            raise TypeError("I buff devono essere rappresentati da una lista")
-        for element in buffs:
-            if not isinstance(element, Buff):
-                raise TypeError("Tutti i buff devono essere un'istanza di Buff")
-        for buff in buffs:
-            buff.duration -= 1
-
     @staticmethod
     def tick_potion(potions: list[Potion]):
         if not isinstance(potions, list):
@@ -253,26 +323,48 @@ class Character(ABC):
                 potions.remove(potion)
 
     @abstractmethod
-    def attack(self, target: "Character") -> int:
+    def attack(self, target: "Character", rng: BattleRng | None = None) -> int:
         pass
 
     def start_turn(self):
-        self.apply_buffs(self.active_buffs)
+        if self.__pending_buffs:
+            self.apply_buffs(self.__pending_buffs)
+            self.__pending_buffs.clear()
 
     def end_round(self):
-        Character.tick_buffs(self.active_buffs)
         self.remove_buffs()
+        poisons = self.__poisons
+        if poisons is not None:
+            poisons.advance()
+            if not poisons:
+                self.__poisons = None
+
+    def reset(self) -> None:
+        if self.__buffs is not None:
+            for buff in self.__buffs:
+                self.__revert_buff(buff)
+        self.__buffs = None
+        self.__pending_buffs = None
+        self.__poisons = None
+        self.__hp = self.__max_hp
+        self.__mana = self.__max_mana
+        self.__special_ability_used = False
 
     def __str__(self):
         return f"{self.name} ({self.hp}/{self.max_hp})"
 
 class Warrior(Character):
-    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], shield: int, speed: int):
-        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed)
-        if not isinstance(shield, int):
-            raise TypeError("Lo scudo deve essere rappresentato da un intero")
-        if shield <= 0:
-            raise ValueError("Lo scudo deve essere maggiore di 0")
+    __slots__ = ("__shield",)
+
+    ATTACK_WEIGHTS = (0.5, 0.3, 0.2)
+
+    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], shield: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed, validate=validate)
+        if validate:
+            if not isinstance(shield, int):
+                raise TypeError("Lo scudo deve essere rappresentato da un intero")
+            if shield <= 0:
+                raise ValueError("Lo scudo deve essere maggiore di 0")
         self.__shield = shield
 
     @property
@@ -284,11 +376,11 @@ class Warrior(Character):
             raise TypeError("Il danno deve essere un intero")
         if damage < 0:
             raise ValueError("Il danno deve essere maggiore di 0")
-        self.hp = max(0, int(self.hp - (damage - (self.base_stats.defense * 0.3) - self.shield)))
+        self.hp = max(0, int(self.hp - (damage - self.damage_mitigation - self.shield)))
 
-    def attack(self, target: "Character") -> int:
+    def attack(self, target: "Character", rng: BattleRng | None = None) -> int:
         if (self.mana - self.mana_per_attack) >= 0:
-            damage_dealt = int((self.base_stats.strength * 0.5) + (self.base_stats.dexterity * 0.3) + (self.base_stats.intelligence * 0.2))
+            damage_dealt = self.attack_power
             target.receive_damage(damage_dealt)
             self.mana -= self.mana_per_attack
             return damage_dealt
@@ -296,16 +388,21 @@ class Warrior(Character):
             return 0
 
 class Cleric(Character):
-    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], poisons_mitigation: int, healing_per_attack: int, speed: int):
-        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed)
-        if not isinstance(poisons_mitigation, int):
-            raise TypeError("La mitigazione dei veleni deve essere rappresentata da un intero")
-        if poisons_mitigation <= 0:
-            raise ValueError("La mitigazione dei veleni deve essere maggiore di 0")
-        if not isinstance(healing_per_attack, int):
-            raise TypeError("I danni recuperati dopo un attacco devono essere rappresentati da un intero")
-        if healing_per_attack <= 0:
-            raise ValueError("I danni recuperati dopo un attacco devono essere maggiori di 0")
+    __slots__ = ("__poisons_mitigation", "__healing_per_attack")
+
+    ATTACK_WEIGHTS = (0.3, 0.3, 0.4)
+
+    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], poisons_mitigation: int, healing_per_attack: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed, validate=validate)
+        if validate:
+            if not isinstance(poisons_mitigation, int):
+                raise TypeError("La mitigazione dei veleni deve essere rappresentata da un intero")
+            if poisons_mitigation <= 0:
+                raise ValueError("La mitigazione dei veleni deve essere maggiore di 0")
+            if not isinstance(healing_per_attack, int):
+                raise TypeError("I danni recuperati dopo un attacco devono essere rappresentati da un intero")
+            if healing_per_attack <= 0:
+                raise ValueError("I danni recuperati dopo un attacco devono essere maggiori di 0")
         self.__poisons_mitigation = poisons_mitigation
         self.__healing_per_attack = healing_per_attack
 
@@ -321,9 +418,9 @@ class Cleric(Character):
         for poison in self.active_poisons:
             poison.damage_per_turn = max(0, poison.damage_per_turn - self.poisons_mitigation)
 
-    def attack(self, target: "Character") -> int:
+    def attack(self, target: "Character", rng: BattleRng | None = None) -> int:
         if (self.mana - self.mana_per_attack) >= 0:
-            damage_dealt = int((self.base_stats.strength * 0.3) + (self.base_stats.dexterity * 0.3) + (self.base_stats.intelligence * 0.4))
+            damage_dealt = self.attack_power
             target.receive_damage(damage_dealt)
             self.mana -= self.mana_per_attack
             self.heal(self.healing_per_attack)
@@ -332,22 +429,27 @@ class Cleric(Character):
             return 0
 
 class Thief(Character):
-    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], critical_bonus: int, speed: int):
-        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed)
-        if not isinstance(critical_bonus, int):
-            raise TypeError("I danni critici devono essere rappresentati da un intero")
-        if critical_bonus <= 0:
-            raise ValueError("I danni critici devono essere rappresentati da un intero")
+    __slots__ = ("__critical_bonus",)
+
+    ATTACK_WEIGHTS = (0.1, 0.4, 0.5)
+
+    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], critical_bonus: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed, validate=validate)
+        if validate:
+            if not isinstance(critical_bonus, int):
+                raise TypeError("I danni critici devono essere rappresentati da un intero")
+            if critical_bonus <= 0:
+                raise ValueError("I danni critici devono essere rappresentati da un intero")
         self.__critical_bonus = critical_bonus
 
     @property
     def critical_bonus(self):
         return self.__critical_bonus
 
-    def attack(self, target: "Character") -> int:
+    def attack(self, target: "Character", rng: BattleRng | None = None) -> int:
         if (self.mana - self.mana_per_attack) >= 0:
-            damage_dealt = int((self.base_stats.strength * 0.1) + (self.base_stats.dexterity * 0.4) + (self.base_stats.intelligence * 0.5))
-            if randint(0, 1) == 1:
+            damage_dealt = self.attack_power
+            if (rng or default_rng()).coin():
                 damage_dealt += self.critical_bonus
             target.receive_damage(damage_dealt)
             self.mana -= self.mana_per_attack
@@ -356,21 +458,31 @@ class Thief(Character):
             return 0
 
 class Wizard(Character):
-    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], buff_amount_boost: int, buff_duration_boost: int, speed: int):
-        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed)
-        if not isinstance(buff_amount_boost, int):
-            raise TypeError("Il boost della quantità del potenziamento deve essere rappresentato da un intero")
-        if buff_amount_boost <= 0:
-            raise ValueError("Il boost della quantità del potenziamento deve essere maggiore di 0")
-        if not isinstance(buff_duration_boost, int):
-            raise TypeError("Il boost della durata del potenziamento deve essere rappresentato da un intero")
-        if buff_duration_boost <= 0:
-            raise ValueError("Il boost della durata del potenziamento deve essere maggiore di 0")
+    __slots__ = ("__buff_amount_boost", "__buff_duration_boost", "amount_boosted", "duration_boosted")
+
+    ATTACK_WEIGHTS = (0.4, 0.2, 0.4)
+
+    def __init__(self, name: str, hp: int, base_stats: Stats, equipment: dict[str, Item | None], mana: int, mana_per_attack: int, special_ability: Buff, potions_set: list[Potion], buff_amount_boost: int, buff_duration_boost: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_stats, equipment, mana, mana_per_attack, special_ability, potions_set, speed, validate=validate)
+        if validate:
+            if not isinstance(buff_amount_boost, int):
+                raise TypeError("Il boost della quantità del potenziamento deve essere rappresentato da un intero")
+            if buff_amount_boost <= 0:
+                raise ValueError("Il boost della quantità del potenziamento deve essere maggiore di 0")
+            if not isinstance(buff_duration_boost, int):
+                raise TypeError("Il boost della durata del potenziamento deve essere rappresentato da un intero")
+            if buff_duration_boost <= 0:
+                raise ValueError("Il boost della durata del potenziamento deve essere maggiore di 0")
         self.__buff_amount_boost = buff_duration_boost
         self.__buff_duration_boost = buff_duration_boost
         self.amount_boosted = False
         self.duration_boosted = False
 
+    def reset(self) -> None:
+        super().reset()
+        self.amount_boosted = False
+        self.duration_boosted = False
+
     @property
     def buff_amount_boost(self):
         return self.__buff_amount_boost
@@ -386,12 +498,12 @@ class Wizard(Character):
 
     def boost_duration(self):
         for buff in self.active_buffs:
-            buff.duration += self.buff_amount_boost
+            self.extend_buff(buff, self.buff_amount_boost)
         self.duration_boosted = True
 
-    def attack(self, target: "Character") -> int:
+    def attack(self, target: "Character", rng: BattleRng | None = None) -> int:
         if (self.mana - self.mana_per_attack) >= 0:
-            damage_dealt = int((self.base_stats.strength * 0.4) + (self.base_stats.dexterity * 0.2) + (self.base_stats.intelligence * 0.4))
+            damage_dealt = self.attack_power
             target.receive_damage(damage_dealt)
             return damage_dealt
         else:
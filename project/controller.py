@@ -1,17 +1,33 @@
+import os
+
 import pygame
 
-from project.view import BaseSprite, SpriteState, ProjectileSprite, UIManager, PLAYER_START_POS, ENEMY_START_POS
+from project.view import BaseSprite, SpriteState, SpritePool, SpriteRegistry, UIManager, PLAYER_START_POS, ENEMY_START_POS
 from project.game_state import GameState
 from project.assets_manager import AssetsManager
 from project.data_manager import DataManager
+from project.profiler import FrameProfiler
+from project.rng import BattleRng
 
 class GameController:
-    def __init__(self):
+    LOGIC_HZ = 60
+    MAX_STEPS_PER_FRAME = 10000
+    REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+    def __init__(self, seed=None, profile=False, time_scale=1.0, render_fps=60):
         WIDTH, HEIGHT = 800, 600
         self.clock = pygame.time.Clock()
         self.running = True
-
-        self.ui = UIManager(WIDTH, HEIGHT)
+        self.time_scale = time_scale
+        self.render_fps = render_fps
+        self.fixed_dt = 1 / self.LOGIC_HZ
+        self.accumulator = 0.0
+        self.logic_steps = 0
+        self.rng = BattleRng(seed)
+        self.spawn_rng = self.rng.spawn("spawn")
+        self.profiler = FrameProfiler(enabled=profile)
+
+        self.ui = UIManager(WIDTH, HEIGHT, profiler=self.profiler)
         self.game_state = GameState.CHARACTER_SELECT
 
         self.turn = "player"
@@ -26,13 +42,39 @@ class GameController:
         self.respawn_timer = 0
 
         self.selected_hero = None
-        self.all_sprites = pygame.sprite.Group()
+        self.enemy_sprite = None
+        self.enemy_pool = SpritePool()
+        self.all_sprites = SpriteRegistry()
         self.inventory_changed = True
 
         self.load_resources()
         self.ui.create_character_selection_screen(self.characters)
         self.ui.create_battle_interface()
 
+    @property
+    def time_scale(self):
+        return self.__time_scale
+
+    @time_scale.setter
+    def time_scale(self, value):
+        if not isinstance(value, (int, float)):
+            raise TypeError("Il fattore di scala del tempo deve essere un numero")
+        if value <= 0:
+            raise ValueError("Il fattore di scala del tempo deve essere maggiore di 0")
+        self.__time_scale = value
+
+    @property
+    def render_fps(self):
+        return self.__render_fps
+
+    @render_fps.setter
+    def render_fps(self, value):
+        if not isinstance(value, int):
+            raise TypeError("Il frame rate di rendering deve essere un intero")
+        if value < 0:
+            raise ValueError("Il frame rate di rendering non può essere negativo")
+        self.__render_fps = value
+
     def load_resources(self):
         chars_objs, weapons_objs, potions_objs = DataManager.load_data()
         self.characters = chars_objs
@@ -45,11 +87,11 @@ class GameController:
     def start_battle(self, selected_hero_model):
         self.selected_hero = selected_hero_model
         hero_frames = self._get_frames(self.selected_hero)
-        self.hero_sprite = BaseSprite(self.selected_hero, PLAYER_START_POS, hero_frames)
+        self.hero_sprite = BaseSprite(self.selected_hero, PLAYER_START_POS, hero_frames, self.rng)
 
         self.pick_new_enemy()
 
-        self.all_sprites = pygame.sprite.Group(self.hero_sprite, self.enemy_sprite)
+        self.all_sprites = SpriteRegistry(self.hero_sprite, self.enemy_sprite)
 
         self.game_state = GameState.BATTLE_MODE
         self.turn = "player"
@@ -68,15 +110,23 @@ class GameController:
             print("Special ability activated")
 
     def pick_new_enemy(self):
-        monster_model = DataManager.get_random_monster()
-        frames = self._get_frames(monster_model)
-        self.enemy_sprite = BaseSprite(monster_model, ENEMY_START_POS, frames)
+        if self.enemy_sprite is not None:
+            DataManager.release_monster(self.enemy_sprite.model)
+            self.enemy_pool.release(self.enemy_sprite)
+        monster_model = DataManager.get_random_monster(self.spawn_rng, self.ui.stage)
+        self.enemy_sprite = self.enemy_pool.acquire(monster_model, ENEMY_START_POS, self.rng)
 
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
+            if event.type in self.REDRAW_EVENTS:
+                self.ui.renderer.invalidate()
+
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.ui.show_profiler = not self.ui.show_profiler
+
             if self.game_state == GameState.CHARACTER_SELECT:
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     selected_model = self.ui.handle_selection_click(event.pos)
@@ -134,8 +184,10 @@ class GameController:
                 self.ui.special_ability_button.clicked = False
 
         self.ui.update()
-        self.all_sprites.update(dt)
-        self._update_battle_logic(dt)
+        with self.profiler.phase("sprites_update"):
+            self.all_sprites.update(dt)
+        with self.profiler.phase("battle_logic"):
+            self._update_battle_logic(dt)
 
         self.ui.attack_button.is_active = (
             self.turn == "player" and not self.player_action_performed and not self.waiting_for_respawn
@@ -179,6 +231,7 @@ class GameController:
             if self.hero_sprite.state == SpriteState.IDLE:
                 self.respawn_timer += dt
                 if self.respawn_timer >= 2.0:
+                    self.ui.refresh_background()
                     self.pick_new_enemy()
                     self.all_sprites.add(self.enemy_sprite)
                     self.waiting_for_respawn = False
@@ -188,7 +241,6 @@ class GameController:
                     self.player_action_performed = False
                     self.enemy_action_performed = False
                     print("Nuovo nemico apparso!")
-                    self.ui.refresh_background()
             return
 
         if self.turn == "player":
@@ -197,7 +249,7 @@ class GameController:
                 self.turn_started = True
                 self.round_active = True
 
-            projectiles_active = any(isinstance(s, ProjectileSprite) for s in self.all_sprites)
+            projectiles_active = self.all_sprites.has("projectile")
 
             if self.player_action_performed and not projectiles_active:
                 if self.hero_sprite.state == SpriteState.IDLE:
@@ -236,14 +288,34 @@ class GameController:
         else:
             self.ui.render_game(self.game_state)
 
-    def run(self):
+    def step(self, frame_time):
+        self.accumulator += frame_time * self.time_scale
+        steps = 0
+        while self.accumulator >= self.fixed_dt and self.running and steps < self.MAX_STEPS_PER_FRAME:
+            self.update(self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            steps += 1
+        if steps == self.MAX_STEPS_PER_FRAME:
+            self.accumulator %= self.fixed_dt
+        self.logic_steps += steps
+        return steps
+
+    def run(self, profile_csv=None):
         while self.running:
-            dt = self.clock.tick(60) / 1000
-            self.handle_events()
-            self.update(dt)
-            self.render()
+            frame_time = self.clock.tick(self.render_fps) / 1000
+            self.profiler.begin_frame()
+            with self.profiler.phase("events"):
+                self.handle_events()
+            with self.profiler.phase("update"):
+                self.step(frame_time)
+            with self.profiler.phase("render_game"):
+                self.render()
+            self.profiler.end_frame()
+        if profile_csv:
+            self.profiler.export_csv(profile_csv)
+        self.ui.close()
         pygame.quit()
 
 if __name__ == "__main__":
-    controller = GameController()
-    controller.run()
+    controller = GameController(profile=bool(os.environ.get("GAME_PROFILE")))
+    controller.run(os.environ.get("GAME_PROFILE_CSV"))
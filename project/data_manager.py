@@ -1,7 +1,16 @@
+import hashlib
 import json
-import random
+import os
+import pickle
+from weakref import WeakKeyDictionary
 from project.assets_manager import AssetsManager
+from project.catalog import Catalog
 from project.factory import GameFactory
+from project.jsonl_catalog import JsonLinesCatalog
+from project.monster_pool import MonsterPool
+from project.rng import BattleRng, default_rng
+from project.schemas import validate_catalogs
+from project.spawn import SpawnTables
 
 class DataManager:
     DATA_FILES = {
@@ -9,11 +18,19 @@ class DataManager:
         "weapons": ("data", "weapons.json"),
         "projectiles": ("data", "projectiles.json"),
         "monsters": ("data", "monsters.json"),
-        "potions": ("data", "potions.json")
+        "potions": ("data", "potions.json"),
+        "spawn_tables": ("data", "spawn_tables.json")
     }
+    BUNDLE_FILE = ("data", "catalog.bundle")
+    BUNDLE_VERSION = 4
 
-    _raw_monsters = []
-    _projectiles = []
+    _catalog = Catalog([], [], [], [], [])
+    _monster_source = []
+    _spawn_tables = SpawnTables()
+    _monster_pool = MonsterPool()
+    _pack_pool = MonsterPool()
+    _pack_generation = 0
+    _pack_keys = WeakKeyDictionary()
 
     @staticmethod
     def _load_json(key):
@@ -21,47 +38,154 @@ class DataManager:
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
 
+    @staticmethod
+    def _source_stamp(key):
+        stat = os.stat(AssetsManager.asset_path("..", *DataManager.DATA_FILES[key]))
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _source_hash(key):
+        with open(AssetsManager.asset_path("..", *DataManager.DATA_FILES[key]), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @staticmethod
+    def _write_bundle(bundle):
+        path = AssetsManager.asset_path("..", *DataManager.BUNDLE_FILE)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(bundle, f, protocol=5)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Errore: Impossibile scrivere {path}: {e}")
+
+    @staticmethod
+    def compile_bundle():
+        raw = {key: DataManager._load_json(key) for key in DataManager.DATA_FILES}
+        validate_catalogs(raw)
+        bundle = {
+            "version": DataManager.BUNDLE_VERSION,
+            "sources": {
+                key: {"stamp": DataManager._source_stamp(key), "hash": DataManager._source_hash(key)}
+                for key in DataManager.DATA_FILES
+            },
+            "data": raw
+        }
+        DataManager._write_bundle(bundle)
+        return bundle
+
+    @staticmethod
+    def _is_fresh(bundle):
+        if bundle.get("version") != DataManager.BUNDLE_VERSION or bundle["sources"].keys() != DataManager.DATA_FILES.keys():
+            return False
+        touched = False
+        for key, source in bundle["sources"].items():
+            stamp = DataManager._source_stamp(key)
+            if tuple(source["stamp"]) == stamp:
+                continue
+            if DataManager._source_hash(key) != source["hash"]:
+                return False
+            source["stamp"] = stamp
+            touched = True
+        if touched:
+            DataManager._write_bundle(bundle)
+        return True
+
+    @staticmethod
+    def load_catalogs():
+        path = AssetsManager.asset_path("..", *DataManager.BUNDLE_FILE)
+        try:
+            with open(path, "rb") as f:
+                bundle = pickle.load(f)
+            if DataManager._is_fresh(bundle):
+                return bundle["data"]
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, AttributeError):
+            pass
+        return DataManager.compile_bundle()["data"]
+
     @staticmethod
     def load_data():
-        raw_chars = DataManager._load_json("characters")
-        raw_weapons = DataManager._load_json("weapons")
-        raw_potions = DataManager._load_json("potions")
-        DataManager._raw_monsters = DataManager._load_json("monsters")
-        DataManager._projectiles = DataManager._load_json("projectiles")
+        catalogs = DataManager.load_catalogs()
+        catalog = Catalog.from_catalogs(catalogs)
+        DataManager._catalog = catalog
+        DataManager._monster_source = catalog.monster_list
+        DataManager._spawn_tables = SpawnTables.from_data(catalogs["spawn_tables"])
+        DataManager._monster_pool.clear()
+        DataManager._clear_pack_pool()
+        for d in catalog.monster_list:
+            DataManager._monster_pool.register(d, trusted=True)
 
-        weapons = [GameFactory.create_weapon(d) for d in raw_weapons]
-        potions = [GameFactory.create_potion(p) for p in raw_potions]
-        weapon_map = {w.name: w for w in weapons}
-        potions_map = {p.name: p for p in potions}
+        weapons = {name: GameFactory.create_weapon(d, trusted=True) for name, d in catalog.weapons.items()}
+        potions = {name: GameFactory.create_potion(d, trusted=True) for name, d in catalog.potions.items()}
 
         characters = []
-        for d in raw_chars:
-            char = GameFactory.create_character(d)
+        for d in catalog.characters.values():
+            char = GameFactory.create_character(d, trusted=True)
             weapon_name = d.get("default_weapon")
-            potions_names = d.get("default_potions")
-            for potion_name in potions_names:
-                char.potions_set.append(potions_map[potion_name])
-            if weapon_name in weapon_map:
-                char.equip(weapon_map[weapon_name])
+            for potion_name in d.get("default_potions"):
+                char.potions_set.append(potions[potion_name])
+            if weapon_name in weapons:
+                char.equip(weapons[weapon_name])
             characters.append(char)
 
-        return characters, weapons, potions
+        return characters, list(weapons.values()), list(potions.values())
+
+    @staticmethod
+    def get_catalog() -> Catalog:
+        return DataManager._catalog
+
+    @staticmethod
+    def load_monster_pack(path):
+        pack = JsonLinesCatalog(path)
+        if isinstance(DataManager._monster_source, JsonLinesCatalog):
+            DataManager._monster_source.close()
+        DataManager._monster_source = pack
+        DataManager._clear_pack_pool()
+        return pack
+
+    @staticmethod
+    def _clear_pack_pool():
+        DataManager._pack_pool.clear()
+        DataManager._pack_generation += 1
+
+    @staticmethod
+    def get_spawn_table(stage=None):
+        return DataManager._spawn_tables.table_for(stage)
 
     @staticmethod
-    def get_random_monster():
-        if not DataManager._raw_monsters:
+    def get_random_monster(rng: BattleRng | None = None, stage=None):
+        source = DataManager._monster_source
+        if isinstance(source, JsonLinesCatalog):
+            return DataManager._get_pack_monster(source, rng)
+
+        table = DataManager.get_spawn_table(stage)
+        if table is not None:
+            return DataManager._monster_pool.acquire(table.sample(rng))
+
+        if not source:
+            return None
+        return DataManager._monster_pool.acquire((rng or default_rng()).choice(source)["name"])
+
+    @staticmethod
+    def _get_pack_monster(pack, rng=None):
+        if not len(pack):
             return None
+        index = int((rng or default_rng()).random() * len(pack))
+        key = (DataManager._pack_generation, index)
+        if key not in DataManager._pack_pool:
+            DataManager._pack_pool.register(pack[index], key=key)
+        monster = DataManager._pack_pool.acquire(key)
+        DataManager._pack_keys[monster] = key
+        return monster
 
-        data = random.choice(DataManager._raw_monsters)
-        return GameFactory.create_monster(data)
+    @staticmethod
+    def release_monster(monster):
+        key = DataManager._pack_keys.pop(monster, None)
+        if key is None:
+            DataManager._monster_pool.release(monster)
+        elif key[0] == DataManager._pack_generation:
+            DataManager._pack_pool.release(monster, key)
 
     @staticmethod
     def get_projectile_data(weapon_name):
-        for p in DataManager._projectiles:
-            if p["weapon"] == weapon_name:
-                return {
-                    "name": p["projectile_type"],
-                    "speed": p["speed"],
-                    "effect": p["effect"]
-                }
-        return None
\ No newline at end of file
+        return DataManager._catalog.projectile_for(weapon_name)
@@ -1,14 +1,24 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, InitVar
 
-@dataclass
+@dataclass(slots=True)
 class Stats:
+    version: int = field(default=0, init=False, repr=False, compare=False)
     strength: int
     intelligence: int
     defense: int
     dexterity: int
+    validate: InitVar[bool] = True
 
-    def __post_init__(self):
-        for name, value in vars(self).items():
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "version":
+            object.__setattr__(self, "version", self.version + 1)
+
+    def __post_init__(self, validate):
+        if not validate:
+            return
+        for stat in fields(self):
+            name, value = stat.name, getattr(self, stat.name)
             if not isinstance(value, int):
                 raise TypeError(f"{name} deve essere un intero")
             if value < 0:
@@ -22,7 +32,8 @@ class Stats:
             strength = self.strength + other.strength,
             intelligence = self.intelligence + other.intelligence,
             defense = self.defense + other.defense,
-            dexterity = self.dexterity + other.dexterity
+            dexterity = self.dexterity + other.dexterity,
+            validate = False
         )
 
     def __sub__(self, other: "Stats"):
@@ -33,21 +44,25 @@ class Stats:
             strength = max(0, (self.strength - other.strength)),
             intelligence = max(0, (self.intelligence - other.intelligence)),
             defense = max(0, (self.defense - other.defense)),
-            dexterity = max(0, (self.dexterity - other.dexterity))
+            dexterity = max(0, (self.dexterity - other.dexterity)),
+            validate = False
         )
 
     def __str__(self):
         return f"Strength: {self.strength}; Intelligence: {self.intelligence}; Defense: {self.defense}; Dexterity: {self.dexterity}"
 
-@dataclass
+@dataclass(slots=True)
 class Buff:
     name: str
     stat: str
     amount: int
     duration: int
     applied: bool=False
+    validate: InitVar[bool] = True
 
-    def __post_init__(self):
+    def __post_init__(self, validate):
+        if not validate:
+            return
         if not isinstance(self.name, str) or self.name == "":
             raise ValueError("Il nome deve essere una stringa non vuota")
         if self.stat not in ["defense", "strength", "dexterity", "intelligence"]:
@@ -64,13 +79,16 @@ class Buff:
     def __str__(self):
         return f"{self.name} che potenzia {self.stat} di {self.amount} per {self.duration} turni"
 
-@dataclass
+@dataclass(slots=True)
 class Poison:
     name: str
     damage_per_turn: int
     duration: int
+    validate: InitVar[bool] = True
 
-    def __post_init__(self):
+    def __post_init__(self, validate):
+        if not validate:
+            return
         if not isinstance(self.name, str) or self.name == "":
             raise ValueError("Il nome deve essere una stringa non vuota")
         if not isinstance(self.damage_per_turn, int):
@@ -4,4 +4,10 @@ class GameError(Exception):
 
 class InvalidEquipError(GameError):
     """Non è stato possibile equipaggiare l'oggetto"""
-    pass
\ No newline at end of file
+    pass
+
+class DataValidationError(GameError):
+    """I file di dati contengono uno o più errori"""
+    def __init__(self, errors: list[str]):
+        self.errors = errors
+        super().__init__(f"{len(errors)} errori nei dati:\n" + "\n".join(errors))
@@ -1,17 +1,22 @@
 from characters import Warrior, Cleric, Thief, Wizard
-from datatypes import Stats, Buff
+from datatypes import Stats, Buff, Poison
 from items import Weapon
 from monsters import Goblin, Spider, Witch, Zombie, Troll
 from project.potions import HealPotion, BuffPotion
 
 class GameFactory:
+        CHARACTER_CLASSES = {"Warrior": Warrior, "Cleric": Cleric, "Thief": Thief, "Wizard": Wizard}
+        MONSTER_CLASSES = {"Goblin": Goblin, "Witch": Witch, "Spider": Spider, "Zombie": Zombie, "Troll": Troll}
+        POTION_CLASSES = {"HealPotion": HealPotion, "BuffPotion": BuffPotion}
+
         @staticmethod
-        def create_character(data):
+        def create_character(data, trusted=False):
             base_stats = Stats(
                 strength=data.get("strength", 0),
                 dexterity=data.get("dexterity", 0),
                 intelligence=data.get("intelligence", 0),
-                defense=data.get("defense", 0)
+                defense=data.get("defense", 0),
+                validate=not trusted
             )
 
             sa = data.get("special_ability", {})
@@ -19,11 +24,11 @@ class GameFactory:
                 name=sa.get("name", ""),
                 stat=sa.get("stat", ""),
                 amount=sa.get("amount", 0),
-                duration=sa.get("duration", 0)
+                duration=sa.get("duration", 0),
+                validate=not trusted
             )
 
-            cls_map = {"Warrior": Warrior, "Cleric": Cleric, "Thief": Thief, "Wizard": Wizard}
-            cls = cls_map.get(data["class"])
+            cls = GameFactory.CHARACTER_CLASSES.get(data["class"])
 
             kwargs = {
                 "name": data["name"],
@@ -34,7 +39,8 @@ class GameFactory:
                 "mana_per_attack": data.get("mana_per_attack", 0),
                 "special_ability": special_ability,
                 "speed": data.get("speed", 10),
-                "potions_set": data["potions_set"]
+                "potions_set": list(data["potions_set"]),
+                "validate": not trusted
             }
 
             if cls is Warrior:
@@ -51,12 +57,13 @@ class GameFactory:
             return cls(**kwargs)
 
         @staticmethod
-        def create_weapon(data):
+        def create_weapon(data, trusted=False):
             base_stats = Stats(
                 strength=data.get("strength", 0),
                 dexterity=data.get("dexterity", 0),
                 intelligence=data.get("intelligence", 0),
-                defense=data.get("defense", 0)
+                defense=data.get("defense", 0),
+                validate=not trusted
             )
             return Weapon(
                 name=data["name"],
@@ -64,13 +71,13 @@ class GameFactory:
                 bonus_stats=base_stats,
                 damage_range=(data["damage_range_min"], data["damage_range_max"]),
                 weapon_type=data["weapon_type"],
-                slot=data["slot"]
+                slot=data["slot"],
+                validate=not trusted
             )
 
         @staticmethod
-        def create_monster(data):
-            cls_map = {"Goblin": Goblin, "Witch": Witch, "Spider": Spider, "Zombie": Zombie, "Troll": Troll}
-            cls = cls_map.get(data["class"])
+        def create_monster(data, level=1, trusted=False):
+            cls = GameFactory.MONSTER_CLASSES.get(data["class"])
 
             kwargs = {
                 "name": data["name"],
@@ -79,24 +86,33 @@ class GameFactory:
                 "bonus_damage": data["bonus_damage"],
                 "speed": data["speed"],
                 "equipment": {"weapon": None, "armor": None},
-                "level": 1
+                "level": level,
+                "validate": not trusted
             }
 
             if cls is Goblin:
                 kwargs["buff_stole_per_turn"] = data["buff_stole_per_turn"]
+            elif cls is Witch:
+                kwargs["poisons"] = [GameFactory.create_poison(p, trusted) for p in data["poisons"]]
+            elif cls is Spider:
+                kwargs["poison"] = GameFactory.create_poison(data["poison"], trusted)
             elif cls is Troll:
                 kwargs["brute_force"] = data["brute_force"]
 
             return cls(**kwargs)
 
         @staticmethod
-        def create_potion(data):
-            cls_map = {"HealPotion": HealPotion, "BuffPotion": BuffPotion}
-            cls = cls_map.get(data["class"])
+        def create_poison(data, trusted=False):
+            return Poison(data["name"], data["damage_per_turn"], data["duration"], validate=not trusted)
+
+        @staticmethod
+        def create_potion(data, trusted=False):
+            cls = GameFactory.POTION_CLASSES.get(data["class"])
             kwargs = {
                 "name": data["name"],
                 "mana_consume": data["mana_consume"],
-                "uses": data["uses"] if data["uses"] else 1
+                "uses": data["uses"] if data["uses"] else 1,
+                "validate": not trusted
             }
 
             if cls is HealPotion:
@@ -105,5 +121,6 @@ class GameFactory:
                 kwargs["buff"] = Buff(data["buff"]["name"],
                                       data["buff"]["stat"],
                                       data["buff"]["amount"],
-                                      data["buff"]["duration"])
-            return cls(**kwargs)
\ No newline at end of file
+                                      data["buff"]["duration"],
+                                      validate=not trusted)
+            return cls(**kwargs)
@@ -4,17 +4,20 @@ from datatypes import Stats
 from valid_slot import WEAPON_SLOTS, ARMOR_SLOTS
 
 class Item(ABC):
-    def __init__(self, name: str, weight: int, bonus_stats: Stats):
-        if not isinstance(name, str):
-            raise TypeError("Il nome deve essere una stringa")
-        if name == "":
-            raise ValueError("Il nome non può essere una stringa vuota")
-        if not isinstance(weight, int):
-            raise TypeError("Il peso deve essere un intero")
-        if weight < 0:
-            raise ValueError("Il peso non può essere negativo")
-        if not isinstance(bonus_stats, Stats):
-            raise TypeError("Le statistiche bonus devono essere un'istanza di Stats")
+    __slots__ = ("__name", "__weight", "__bonus_stats")
+
+    def __init__(self, name: str, weight: int, bonus_stats: Stats, validate: bool = True):
+        if validate:
+            if not isinstance(name, str):
+                raise TypeError("Il nome deve essere una stringa")
+            if name == "":
+                raise ValueError("Il nome non può essere una stringa vuota")
+            if not isinstance(weight, int):
+                raise TypeError("Il peso deve essere un intero")
+            if weight < 0:
+                raise ValueError("Il peso non può essere negativo")
+            if not isinstance(bonus_stats, Stats):
+                raise TypeError("Le statistiche bonus devono essere un'istanza di Stats")
         self.__name = name
         self.__weight = weight
         self.__bonus_stats = bonus_stats
@@ -49,23 +52,26 @@ class Item(ABC):
         return f"{self.name} equipaggiato nello slot {self.slot}"
 
 class Weapon(Item):
-    def __init__(self, name: str, weight: int, bonus_stats: Stats, damage_range: tuple[int, int], weapon_type: str, slot: str):
-        super().__init__(name, weight, bonus_stats)
-        if not isinstance(damage_range, tuple) or not isinstance(damage_range[0], int) or not isinstance(damage_range[1], int):
-            raise TypeError("Il raggio dei danni deve essere una tupla composta da due interi")
-        min_damage, max_damage = damage_range
-        if min_damage > max_damage:
-            raise ValueError("Il danno minimo non può essere maggiore del danno massimo")
-        if min_damage < 0 or max_damage < 0:
-            raise ValueError("Sia il danno minimo che il danno massimo devono essere maggiori di 0")
-        if not isinstance(weapon_type, str):
-            raise TypeError("Il tipo dell'arma deve essere una stringa")
-        if weapon_type not in ["melee", "ranged"]:
-            raise ValueError("Il tipo dell'arma deve essere o melee o ranged")
-        if not isinstance(slot, str):
-            raise TypeError("Lo slot dell'arma deve essere una stringa")
-        if slot not in WEAPON_SLOTS:
-            raise ValueError(f"L'arma può essere equipaggiata solo negli slot: {WEAPON_SLOTS}")
+    __slots__ = ("__damage_range", "__weapon_type", "__slot")
+
+    def __init__(self, name: str, weight: int, bonus_stats: Stats, damage_range: tuple[int, int], weapon_type: str, slot: str, validate: bool = True):
+        super().__init__(name, weight, bonus_stats, validate=validate)
+        if validate:
+            if not isinstance(damage_range, tuple) or not isinstance(damage_range[0], int) or not isinstance(damage_range[1], int):
+                raise TypeError("Il raggio dei danni deve essere una tupla composta da due interi")
+            min_damage, max_damage = damage_range
+            if min_damage > max_damage:
+                raise ValueError("Il danno minimo non può essere maggiore del danno massimo")
+            if min_damage < 0 or max_damage < 0:
+                raise ValueError("Sia il danno minimo che il danno massimo devono essere maggiori di 0")
+            if not isinstance(weapon_type, str):
+                raise TypeError("Il tipo dell'arma deve essere una stringa")
+            if weapon_type not in ["melee", "ranged"]:
+                raise ValueError("Il tipo dell'arma deve essere o melee o ranged")
+            if not isinstance(slot, str):
+                raise TypeError("Lo slot dell'arma deve essere una stringa")
+            if slot not in WEAPON_SLOTS:
+                raise ValueError(f"L'arma può essere equipaggiata solo negli slot: {WEAPON_SLOTS}")
         self.__damage_range = damage_range
         self.__weapon_type = weapon_type
         self.__slot = slot
@@ -94,12 +100,15 @@ class Weapon(Item):
         return self.__weapon_type
 
 class ArmorPiece(Item):
-    def __init__(self, name: str, weight: int, bonus_stats: Stats, slot: str):
-        super().__init__(name, weight, bonus_stats)
-        if not isinstance(slot, str):
-            raise TypeError("Lo slot in cui il pezzo dell'armatura può essere equipaggiato deve essere una stringa")
-        if slot not in ARMOR_SLOTS:
-            raise ValueError(f"Un pezzo di armatura può essere equipaggiato solo negli slot: {ARMOR_SLOTS}")
+    __slots__ = ("__slot",)
+
+    def __init__(self, name: str, weight: int, bonus_stats: Stats, slot: str, validate: bool = True):
+        super().__init__(name, weight, bonus_stats, validate=validate)
+        if validate:
+            if not isinstance(slot, str):
+                raise TypeError("Lo slot in cui il pezzo dell'armatura può essere equipaggiato deve essere una stringa")
+            if slot not in ARMOR_SLOTS:
+                raise ValueError(f"Un pezzo di armatura può essere equipaggiato solo negli slot: {ARMOR_SLOTS}")
         self.__slot = slot
 
     @property
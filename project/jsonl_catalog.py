@@ -0,0 +1,124 @@
+import json
+import os
+import pickle
+from array import array
+from typing import Iterable, Iterator
+
+INDEX_SUFFIX = ".idx"
+KEYS_SUFFIX = ".keys"
+INDEX_VERSION = 1
+
+def write_json_lines(records: Iterable[dict], path: str) -> int:
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+    return count
+
+class JsonLinesCatalog:
+    def __init__(self, path: str, key: str = "name"):
+        self.path = path
+        self.key = key
+        self._file = None
+        self._by_key = None
+        self._offsets = self._load_index()
+
+    def _stamp(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_sidecar(self, suffix, stamp):
+        try:
+            with open(self.path + suffix, "rb") as f:
+                index = pickle.load(f)
+            if index["version"] == INDEX_VERSION and index["key"] == self.key and tuple(index["stamp"]) == stamp:
+                return index["data"]
+        except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_sidecar(self, suffix, stamp, data):
+        try:
+            with open(self.path + suffix, "wb") as f:
+                pickle.dump({"version": INDEX_VERSION, "key": self.key, "stamp": stamp, "data": data}, f, protocol=5)
+        except OSError as e:
+            print(f"Errore: Impossibile scrivere {self.path + suffix}: {e}")
+
+    def _load_index(self):
+        stamp = self._stamp()
+        offsets = self._read_sidecar(INDEX_SUFFIX, stamp)
+        if offsets is None:
+            keys, offsets = self._scan()
+            self._write_sidecar(INDEX_SUFFIX, stamp, offsets)
+            self._write_sidecar(KEYS_SUFFIX, stamp, keys)
+        return offsets
+
+    def _scan(self):
+        keys = []
+        offsets = array("Q")
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line_number, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Riga {line_number} di {self.path} non valida: {e}") from e
+                    if self.key not in record:
+                        raise ValueError(f"Riga {line_number} di {self.path} senza il campo {self.key}")
+                    keys.append(record[self.key])
+                    offsets.append(offset)
+                offset += len(line)
+        return keys, offsets
+
+    def _read_at(self, offset: int) -> dict:
+        if self._file is None:
+            self._file = open(self.path, "rb")
+        self._file.seek(offset)
+        return json.loads(self._file.readline())
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> dict:
+        return self._read_at(self._offsets[index])
+
+    def __contains__(self, key) -> bool:
+        return key in self._key_index()
+
+    def __iter__(self) -> Iterator[dict]:
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _key_index(self):
+        if self._by_key is None:
+            keys = self._read_sidecar(KEYS_SUFFIX, self._stamp())
+            if keys is None or len(keys) != len(self._offsets):
+                keys, self._offsets = self._scan()
+            self._by_key = {key: i for i, key in enumerate(keys)}
+        return self._by_key
+
+    @property
+    def keys(self) -> list:
+        return list(self._key_index())
+
+    def get(self, key) -> dict:
+        index = self._key_index().get(key)
+        if index is None:
+            raise KeyError(f"Nessun record con {self.key} = {key}")
+        return self[index]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
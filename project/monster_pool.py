@@ -0,0 +1,39 @@
+from project.factory import GameFactory
+from project.schemas import validate_monster
+
+class MonsterPool:
+    def __init__(self):
+        self._prototypes = {}
+        self._free = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._prototypes
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._prototypes)
+
+    def register(self, data: dict, trusted: bool = False, key=None) -> None:
+        if not trusted:
+            validate_monster(data)
+        self._prototypes[data["name"] if key is None else key] = data
+
+    def acquire(self, key, level: int = 1):
+        if key not in self._prototypes:
+            raise KeyError(f"Nessun prototipo registrato per il mostro {key}")
+        free = self._free.get((key, level))
+        if free:
+            monster = free.pop()
+            monster.reset()
+            return monster
+        return GameFactory.create_monster(self._prototypes[key], level, trusted=True)
+
+    def release(self, monster, key=None) -> None:
+        key = monster.name if key is None else key
+        if key not in self._prototypes:
+            raise ValueError("Il mostro non proviene da questo pool")
+        self._free.setdefault((key, monster.level), []).append(monster)
+
+    def clear(self) -> None:
+        self._prototypes.clear()
+        self._free.clear()
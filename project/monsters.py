@@ -1,44 +1,47 @@
 from abc import ABC
-from random import choice, randint
 
 from characters import Character
 from datatypes import Poison
 from items import Item
+from rng import BattleRng, default_rng
 from valid_slot import CHARACTER_SLOTS
 
 class Monster(ABC):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item | None], level: int, speed: int):
-        if not isinstance(name, str):
-            raise TypeError("Il nome deve essere una stringa")
-        if name == "":
-            raise ValueError("Il nome non può essere una stringa vuota")
-        if not isinstance(hp, int):
-            raise TypeError("I punti vita devono essere rappresentati da un intero")
-        if hp <= 0:
-            raise ValueError("I punti vita devono essere inizializzati maggiori di 0")
-        if not isinstance(base_damage, int):
-            raise TypeError("I danni base devono essere rappresentati da un intero")
-        if base_damage <= 0:
-            raise ValueError("I danni base devono essere maggiori di 0")
-        if not isinstance(bonus_damage, int):
-            raise TypeError("I danni bonus devono essere rappresentati da un intero")
-        if bonus_damage <= 0:
-            raise ValueError("I danni bonus devono essere maggiori di 0")
-        if not isinstance(equipment, dict):
-            raise TypeError("L'equipaggiamento deve essere un dizionario")
-        for k, v in equipment.items():
-            if k not in CHARACTER_SLOTS:
-                raise ValueError(f"Gli oggetti possono essere equipaggiati solo in questi slot: {CHARACTER_SLOTS}")
-            if not isinstance(v, Item) and v is not None:
-                raise ValueError("Gli unici oggetti validi da poter equipaggiare sono le istanze di Item o le sue sottoclassi")
-        if not isinstance(level, int):
-            raise TypeError("Il livello deve essere rappresentato da un intero")
-        if level <= 0:
-            raise ValueError("Il livello deve essere maggiore di 0")
-        if not isinstance(speed, int):
-            raise TypeError("La velocità deve essere rappresentata da un intero")
-        if speed <= 0:
-            raise ValueError("La velocità deve essere maggiore di 0")
+    __slots__ = ("level", "__name", "__hp", "__max_hp", "__base_damage", "__bonus_damage", "__equipment", "__speed", "__weakref__")
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item | None], level: int, speed: int, validate: bool = True):
+        if validate:
+            if not isinstance(name, str):
+                raise TypeError("Il nome deve essere una stringa")
+            if name == "":
+                raise ValueError("Il nome non può essere una stringa vuota")
+            if not isinstance(hp, int):
+                raise TypeError("I punti vita devono essere rappresentati da un intero")
+            if hp <= 0:
+                raise ValueError("I punti vita devono essere inizializzati maggiori di 0")
+            if not isinstance(base_damage, int):
+                raise TypeError("I danni base devono essere rappresentati da un intero")
+            if base_damage <= 0:
+                raise ValueError("I danni base devono essere maggiori di 0")
+            if not isinstance(bonus_damage, int):
+                raise TypeError("I danni bonus devono essere rappresentati da un intero")
+            if bonus_damage <= 0:
+                raise ValueError("I danni bonus devono essere maggiori di 0")
+            if not isinstance(equipment, dict):
+                raise TypeError("L'equipaggiamento deve essere un dizionario")
+            for k, v in equipment.items():
+                if k not in CHARACTER_SLOTS:
+                    raise ValueError(f"Gli oggetti possono essere equipaggiati solo in questi slot: {CHARACTER_SLOTS}")
+                if not isinstance(v, Item) and v is not None:
+                    raise ValueError("Gli unici oggetti validi da poter equipaggiare sono le istanze di Item o le sue sottoclassi")
+            if not isinstance(level, int):
+                raise TypeError("Il livello deve essere rappresentato da un intero")
+            if level <= 0:
+                raise ValueError("Il livello deve essere maggiore di 0")
+            if not isinstance(speed, int):
+                raise TypeError("La velocità deve essere rappresentata da un intero")
+            if speed <= 0:
+                raise ValueError("La velocità deve essere maggiore di 0")
 
         self.level = level
         self.__name = name
@@ -90,10 +93,13 @@ class Monster(ABC):
             raise TypeError("Il danno deve essere un intero")
         if damage < 0:
             raise ValueError("Il danno deve essere maggiore di 0")
-        self.hp = max(0, self.hp - damage)
+        self.__hp = max(0, self.__hp - damage)
+
+    def reset(self) -> None:
+        self.__hp = self.__max_hp * self.level
 
     @staticmethod
-    def drop_item(items: dict[str, Item | None]) -> Item | None:
+    def drop_item(items: dict[str, Item | None], rng: BattleRng | None = None) -> Item | None:
         possible_drop = []
         for v in items.values():
             if v is not None:
@@ -101,58 +107,72 @@ class Monster(ABC):
         if not possible_drop:
             return None
         else:
-            return choice(possible_drop)
+            return (rng or default_rng()).choice(possible_drop)
 
-    def attack(self, target: Character) -> int:
+    def attack(self, target: Character, rng: BattleRng | None = None) -> int:
+        rng = rng or default_rng()
         damage = self.base_damage
-        if randint(0, 1) == 1:
+        if rng.coin():
             damage += self.bonus_damage
         target.receive_damage(damage)
         return damage
 
 class Goblin(Monster):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], buff_stole_per_turn: int, level: int, speed: int):
-        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed)
-        if not isinstance(buff_stole_per_turn, int):
-            raise TypeError("Il numero di buff da rimuovere per turno deve essere rappresentato da un intero")
-        if buff_stole_per_turn <= 0:
-            raise ValueError("Il numero di buff da rimuovere per turno deve essere maggiore di 0")
+    __slots__ = ("__buff_stole_per_turn",)
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], buff_stole_per_turn: int, level: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed, validate=validate)
+        if validate:
+            if not isinstance(buff_stole_per_turn, int):
+                raise TypeError("Il numero di buff da rimuovere per turno deve essere rappresentato da un intero")
+            if buff_stole_per_turn <= 0:
+                raise ValueError("Il numero di buff da rimuovere per turno deve essere maggiore di 0")
         self.__buff_stole_per_turn = buff_stole_per_turn
 
     @property
     def buff_stole_per_turn(self):
         return self.__buff_stole_per_turn
 
-    def steal(self, target: Character) -> None:
+    def steal(self, target: Character, rng: BattleRng | None = None) -> None:
         if not isinstance(target, Character):
             raise TypeError("I buff possono essere rimossi solo da sottoclassi di Character")
-        if len(target.active_buffs) <= self.buff_stole_per_turn:
-            target.active_buffs = []
+        active_buffs = target.active_buffs
+        if len(active_buffs) <= self.buff_stole_per_turn:
+            stolen_buffs = active_buffs
         else:
-            for i in range(self.buff_stole_per_turn):
-                random_buff_removed = choice(target.active_buffs)
-                target.active_buffs.remove(random_buff_removed)
+            stolen_buffs = (rng or default_rng()).sample(active_buffs, self.buff_stole_per_turn)
+        for buff in stolen_buffs:
+            target.remove_buff(buff)
 
-    def attack(self, target: Character) -> int:
+    def attack(self, target: Character, rng: BattleRng | None = None) -> int:
+        rng = rng or default_rng()
         damage = self.base_damage
-        if randint(0, 1) == 1:
+        if rng.coin():
             damage += self.bonus_damage
-        if randint(0, 100) < 20:
+        if rng.chance(20):
             damage += self.bonus_damage
         target.receive_damage(damage)
         return damage
 
 class Witch(Monster):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, poisons: list[Poison], speed: int):
-        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed)
-        if not isinstance(poisons, list):
-            raise TypeError("I veleni devono essere rappresentati da una lista")
-        for element in poisons:
-            if not isinstance(element, Poison):
-                raise TypeError("I veleni devono essere istanze della classe Poison")
+    __slots__ = ("poisons", "__initial_poisons")
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, poisons: list[Poison], speed: int, validate: bool = True):
+        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed, validate=validate)
+        if validate:
+            if not isinstance(poisons, list):
+                raise TypeError("I veleni devono essere rappresentati da una lista")
+            for element in poisons:
+                if not isinstance(element, Poison):
+                    raise TypeError("I veleni devono essere istanze della classe Poison")
         for poison in poisons:
             poison.damage_per_turn *= level
         self.poisons = poisons
+        self.__initial_poisons = [(p.name, p.damage_per_turn, p.duration) for p in poisons]
+
+    def reset(self) -> None:
+        super().reset()
+        self.poisons = [Poison(*values, validate=False) for values in self.__initial_poisons]
 
     def cast_poison(self, poison: Poison, target: Character):
         if not isinstance(poison, Poison):
@@ -162,22 +182,29 @@ class Witch(Monster):
         target.add_poison(poison)
         self.poisons.remove(poison)
 
-    def attack(self, target: Character) -> int:
+    def attack(self, target: Character, rng: BattleRng | None = None) -> int:
+        rng = rng or default_rng()
         damage = self.base_damage
-        if randint(0, 1) == 1:
+        if rng.coin():
             damage += self.bonus_damage
         if self.poisons:
-            poison = choice(self.poisons)
+            poison = rng.choice(self.poisons)
             self.cast_poison(poison, target)
         target.receive_damage(damage)
         return damage
 
 class Zombie(Monster):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, speed: int):
-        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed)
+    __slots__ = ("__initial_hp", "can_revive")
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed, validate=validate)
         self.__initial_hp = hp
         self.can_revive = True
 
+    def reset(self) -> None:
+        super().reset()
+        self.can_revive = True
+
     @property
     def initial_hp(self):
         return self.__initial_hp
@@ -196,18 +223,27 @@ class Zombie(Monster):
         self.revive()
 
 class Spider(Monster):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, poison: Poison, speed: int):
-        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed)
-        if not isinstance(poison, Poison):
-            raise TypeError("Il veleno deve essere un'istanza di Poison")
+    __slots__ = ("__poison", "__initial_poison", "can_use_potion")
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item], level: int, poison: Poison, speed: int, validate: bool = True):
+        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed, validate=validate)
+        if validate:
+            if not isinstance(poison, Poison):
+                raise TypeError("Il veleno deve essere un'istanza di Poison")
         poison.damage_per_turn *= level
         poison.duration *= level
         self.__poison = poison
+        self.__initial_poison = (poison.name, poison.damage_per_turn, poison.duration)
+        self.can_use_potion = True
+
+    def reset(self) -> None:
+        super().reset()
+        self.__poison = Poison(*self.__initial_poison, validate=False)
         self.can_use_potion = True
 
     @property
     def poison(self):
-        return self.poison
+        return self.__poison
 
     def cast_poison(self, poison: Poison, target: Character):
         if not isinstance(poison, Poison):
@@ -217,29 +253,33 @@ class Spider(Monster):
         target.add_poison(poison)
         self.can_use_potion = False
 
-    def attack(self, target: Character) -> int:
+    def attack(self, target: Character, rng: BattleRng | None = None) -> int:
+        rng = rng or default_rng()
         damage = self.base_damage
-        if randint(0, 1) == 1:
+        if rng.coin():
             damage += self.bonus_damage
-        if randint(0, 100) < 40 and self.can_use_potion:
+        if rng.chance(40) and self.can_use_potion:
             self.cast_poison(self.poison, target)
         target.receive_damage(damage)
         return damage
 
 class Troll(Monster):
-    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item | None], level: int, speed: int, brute_force: int):
-        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed)
-        if not isinstance(brute_force, int):
-            raise TypeError("La forza bruta deve essere rappresentata da un intero")
-        if brute_force <= 0:
-            raise ValueError("La forza bruta deve essere maggiore di 0")
+    __slots__ = ("__brute_force",)
+
+    def __init__(self, name: str, hp: int, base_damage: int, bonus_damage: int, equipment: dict[str, Item | None], level: int, speed: int, brute_force: int, validate: bool = True):
+        super().__init__(name, hp, base_damage, bonus_damage, equipment, level, speed, validate=validate)
+        if validate:
+            if not isinstance(brute_force, int):
+                raise TypeError("La forza bruta deve essere rappresentata da un intero")
+            if brute_force <= 0:
+                raise ValueError("La forza bruta deve essere maggiore di 0")
         self.__brute_force = brute_force
 
     @property
     def brute_force(self):
         return self.__brute_force
 
-    def attack(self, target: Character) -> int:
+    def attack(self, target: Character, rng: BattleRng | None = None) -> int:
         damage = self.base_damage
         if self.hp < self.max_hp // 2:
             damage += self.brute_force
@@ -3,19 +3,22 @@ from abc import abstractmethod, ABC
 from datatypes import Buff
 
 class Potion(ABC):
-    def __init__(self, name: str, mana_consume: int, uses=1):
-        if not isinstance(name, str):
-            raise TypeError("Il nome deve essere una stringa")
-        if name == "":
-            raise ValueError("Il nome non può essere una stringa vuota")
-        if not isinstance(mana_consume, int):
-            raise TypeError("Il consumo di mana della pozione deve essere un intero")
-        if mana_consume < 0:
-            raise ValueError("Il consumo di mana della pozione non può essere negativo")
-        if not isinstance(uses, int):
-            raise TypeError("Il numero di usi deve essere un intero")
-        if uses <= 0:
-            raise ValueError("Il numero di usi deve essere maggiore di 0")
+    __slots__ = ("__name", "__mana_consume", "__uses")
+
+    def __init__(self, name: str, mana_consume: int, uses=1, validate: bool = True):
+        if validate:
+            if not isinstance(name, str):
+                raise TypeError("Il nome deve essere una stringa")
+            if name == "":
+                raise ValueError("Il nome non può essere una stringa vuota")
+            if not isinstance(mana_consume, int):
+                raise TypeError("Il consumo di mana della pozione deve essere un intero")
+            if mana_consume < 0:
+                raise ValueError("Il consumo di mana della pozione non può essere negativo")
+            if not isinstance(uses, int):
+                raise TypeError("Il numero di usi deve essere un intero")
+            if uses <= 0:
+                raise ValueError("Il numero di usi deve essere maggiore di 0")
         self.__name = name
         self.__mana_consume = mana_consume
         self.__uses = uses
@@ -45,12 +48,15 @@ class Potion(ABC):
         pass
 
 class HealPotion(Potion):
-    def __init__(self, name: str, mana_consume: int, healing_effect: int, uses=1):
-        super().__init__(name, mana_consume, uses)
-        if not isinstance(healing_effect, int):
-            raise TypeError("L'effetto di cura deve essere un intero")
-        if healing_effect <= 0:
-            raise ValueError("L'effetto di cura deve essere maggiore di 0")
+    __slots__ = ("__healing_effect",)
+
+    def __init__(self, name: str, mana_consume: int, healing_effect: int, uses=1, validate: bool = True):
+        super().__init__(name, mana_consume, uses, validate=validate)
+        if validate:
+            if not isinstance(healing_effect, int):
+                raise TypeError("L'effetto di cura deve essere un intero")
+            if healing_effect <= 0:
+                raise ValueError("L'effetto di cura deve essere maggiore di 0")
         self.__healing_effect = healing_effect
 
     @property
@@ -68,10 +74,13 @@ class HealPotion(Potion):
         return f"{self.name}: pozione dal costo di {self.mana_consume} che cura {self.__healing_effect} e può essere utilizzata {self.uses} volte"
 
 class BuffPotion(Potion):
-    def __init__(self, name: str, mana_consume: int, buff: Buff, uses=1):
-        super().__init__(name, mana_consume, uses)
-        if not isinstance(buff, Buff):
-            raise TypeError("Il buff dato dalla pozione deve essere un'istanza di Buff")
+    __slots__ = ("__buff",)
+
+    def __init__(self, name: str, mana_consume: int, buff: Buff, uses=1, validate: bool = True):
+        super().__init__(name, mana_consume, uses, validate=validate)
+        if validate:
+            if not isinstance(buff, Buff):
+                raise TypeError("Il buff dato dalla pozione deve essere un'istanza di Buff")
         self.__buff = buff
 
     @property
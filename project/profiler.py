@@ -0,0 +1,96 @@
+import csv
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+
+class FrameProfiler:
+    FRAME = "frame"
+
+    def __init__(self, capacity: int = 600, enabled: bool = True):
+        if not isinstance(capacity, int):
+            raise TypeError("La capacità del profiler deve essere un intero")
+        if capacity <= 0:
+            raise ValueError("La capacità del profiler deve essere maggiore di 0")
+        self.capacity = capacity
+        self.enabled = enabled
+        self.frames = 0
+        self._index = 0
+        self._samples = {self.FRAME: array("d", bytes(8 * capacity))}
+        self._current = {}
+        self._frame_start = None
+
+    def __len__(self):
+        return min(self.frames, self.capacity)
+
+    @property
+    def phases(self) -> list[str]:
+        return list(self._samples)
+
+    def begin_frame(self) -> None:
+        if self.enabled:
+            self._current.clear()
+            self._frame_start = time.perf_counter()
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def end_frame(self) -> None:
+        if not self.enabled or self._frame_start is None:
+            return
+        self._current[self.FRAME] = (time.perf_counter() - self._frame_start) * 1000
+        for name in self._current:
+            if name not in self._samples:
+                self._samples[name] = array("d", bytes(8 * self.capacity))
+        for name, samples in self._samples.items():
+            samples[self._index] = self._current.get(name, 0.0)
+        self._index = (self._index + 1) % self.capacity
+        self.frames += 1
+        self._frame_start = None
+
+    def samples(self, name: str = FRAME) -> list[float]:
+        if name not in self._samples:
+            raise KeyError(f"Fase non registrata: {name}")
+        samples = self._samples[name]
+        if self.frames < self.capacity:
+            return samples[:self.frames].tolist()
+        return (samples[self._index:] + samples[:self._index]).tolist()
+
+    def percentile(self, q: float, name: str = FRAME) -> float:
+        if not 0 <= q <= 100:
+            raise ValueError("Il percentile deve essere compreso tra 0 e 100")
+        values = sorted(self.samples(name))
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(q / 100 * len(values)))]
+
+    def summary(self) -> dict[str, tuple[float, float]]:
+        return {name: (self.percentile(50, name), self.percentile(99, name)) for name in self._samples}
+
+    def overlay_text(self) -> str:
+        return f"frame p50 {self.percentile(50):.2f} ms  p99 {self.percentile(99):.2f} ms"
+
+    def export_csv(self, path: str) -> None:
+        names = self.phases
+        columns = [self.samples(name) for name in names]
+        first = self.frames - len(self)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame_index"] + [f"{name}_ms" for name in names])
+            for i, row in enumerate(zip(*columns)):
+                writer.writerow([first + i] + [f"{value:.4f}" for value in row])
+
+    def reset(self) -> None:
+        self.frames = 0
+        self._index = 0
+        for samples in self._samples.values():
+            samples[:] = array("d", bytes(8 * self.capacity))
@@ -0,0 +1,141 @@
+import hashlib
+import random
+import sys
+from array import array
+from typing import Sequence, TypeVar
+
+T = TypeVar("T")
+
+UNIT = 2.0 ** -53
+GOLDEN = 0x9E3779B97F4A7C15
+MASK = (1 << 64) - 1
+STREAM_MULTIPLIER = 6364136223846793005
+STREAM_INCREMENT = 1442695040888963407
+
+def splitmix64(z: int) -> int:
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+    return z ^ (z >> 31)
+
+class BattleRng:
+    BLOCK_SIZE = 1024
+
+    def __init__(self, seed: int | str | None = None, block_size: int = BLOCK_SIZE):
+        if not isinstance(block_size, int):
+            raise TypeError("La dimensione del blocco deve essere un intero")
+        if block_size <= 0:
+            raise ValueError("La dimensione del blocco deve essere maggiore di 0")
+        self.seed = seed
+        self.block_size = block_size
+        self._random = random.Random(seed)
+        self._block = array("Q")
+        self._index = 0
+        self._stream_key = None
+
+    def _draw_words(self, count: int) -> array:
+        words = array("Q")
+        if count > 0:
+            words.frombytes(self._random.getrandbits(64 * count).to_bytes(8 * count, "little"))
+            if sys.byteorder == "big":
+                words.byteswap()
+        return words
+
+    def _refill(self) -> None:
+        self._block = self._draw_words(self.block_size)
+        self._index = 0
+
+    def random(self) -> float:
+        if self._index >= len(self._block):
+            self._refill()
+        word = self._block[self._index]
+        self._index += 1
+        return (word >> 11) * UNIT
+
+    def randint(self, a: int, b: int) -> int:
+        return a + int(self.random() * (b - a + 1))
+
+    def coin(self) -> bool:
+        return self.random() >= 0.5
+
+    def chance(self, percent: int) -> bool:
+        return self.randint(0, 100) < percent
+
+    def choice(self, seq: Sequence[T]) -> T:
+        if not seq:
+            raise IndexError("Impossibile scegliere da una sequenza vuota")
+        return seq[int(self.random() * len(seq))]
+
+    def sample(self, seq: Sequence[T], k: int) -> list[T]:
+        pool = list(seq)
+        if not 0 <= k <= len(pool):
+            raise ValueError("Il campione non può essere più grande della sequenza")
+        for i in range(k):
+            j = i + int(self.random() * (len(pool) - i))
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def words(self, size: int) -> array:
+        if not isinstance(size, int):
+            raise TypeError("La dimensione del blocco deve essere un intero")
+        if size < 0:
+            raise ValueError("La dimensione del blocco non può essere negativa")
+        end = min(len(self._block), self._index + size)
+        words = self._block[self._index:end]
+        self._index = end
+        words.extend(self._draw_words(size - len(words)))
+        return words
+
+    def spawn(self, key) -> "BattleRng":
+        if self.seed is None:
+            return BattleRng(self._random.getrandbits(64), self.block_size)
+        return BattleRng(f"{self.seed}:{key}", self.block_size)
+
+    @property
+    def stream_key(self) -> int:
+        if self._stream_key is None:
+            if self.seed is None:
+                self._stream_key = self._random.getrandbits(64)
+            else:
+                self._stream_key = int.from_bytes(hashlib.blake2b(str(self.seed).encode(), digest_size=8).digest(), "little")
+        return self._stream_key
+
+    def stream(self, index: int) -> "BattleStream":
+        if not isinstance(index, int):
+            raise TypeError("L'indice della battaglia deve essere un intero")
+        if index < 0:
+            raise ValueError("L'indice della battaglia non può essere negativo")
+        return BattleStream(splitmix64((self.stream_key + (index + 1) * GOLDEN) & MASK))
+
+class BattleStream(BattleRng):
+    def __init__(self, key: int):
+        self.key = key
+        self.state = key
+
+    def random(self) -> float:
+        self.state = state = (self.state * STREAM_MULTIPLIER + STREAM_INCREMENT) & MASK
+        return (state >> 11) * UNIT
+
+    def words(self, size: int) -> array:
+        if not isinstance(size, int):
+            raise TypeError("La dimensione del blocco deve essere un intero")
+        if size < 0:
+            raise ValueError("La dimensione del blocco non può essere negativa")
+        words = array("Q")
+        state = self.state
+        for _ in range(size):
+            state = (state * STREAM_MULTIPLIER + STREAM_INCREMENT) & MASK
+            words.append(state)
+        self.state = state
+        return words
+
+    def spawn(self, key) -> BattleRng:
+        return BattleRng(f"{self.key}:{key}")
+
+    @property
+    def stream_key(self) -> int:
+        return self.key
+
+_default_rng = BattleRng()
+
+def default_rng() -> BattleRng:
+    return _default_rng
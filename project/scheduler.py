@@ -0,0 +1,59 @@
+import heapq
+from itertools import count
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+
+class ExpiryScheduler(Generic[T]):
+    __slots__ = ("round", "_heap", "_expiry", "_counter")
+
+    def __init__(self):
+        self.round = 0
+        self._heap = []
+        self._expiry = {}
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._expiry)
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._expiry
+
+    def __iter__(self) -> Iterator[T]:
+        return (item for _, item in self._expiry.values())
+
+    def schedule(self, item: T, duration: int) -> None:
+        if not isinstance(duration, int):
+            raise TypeError("La durata deve essere un intero")
+        self._push(item, self.round + duration)
+
+    def extend(self, item: T, extra: int) -> None:
+        if not isinstance(extra, int):
+            raise TypeError("L'estensione della durata deve essere un intero")
+        if item not in self:
+            raise ValueError("L'elemento non è pianificato")
+        self._push(item, self._expiry[id(item)][0] + extra)
+
+    def remaining(self, item: T) -> int:
+        if item not in self:
+            raise ValueError("L'elemento non è pianificato")
+        return self._expiry[id(item)][0] - self.round
+
+    def cancel(self, item: T) -> None:
+        self._expiry.pop(id(item), None)
+
+    def advance(self) -> list[T]:
+        self.round += 1
+        heap = self._heap
+        expired = []
+        while heap and heap[0][0] <= self.round:
+            expiry, _, item = heapq.heappop(heap)
+            entry = self._expiry.get(id(item))
+            if entry is not None and entry[0] == expiry and entry[1] is item:
+                del self._expiry[id(item)]
+                expired.append(item)
+        return expired
+
+    def _push(self, item, expiry):
+        self._expiry[id(item)] = (expiry, item)
+        heapq.heappush(self._heap, (expiry, next(self._counter), item))
@@ -0,0 +1,319 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from project.errors import DataValidationError
+
+MISSING = object()
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    type: type | tuple[type, ...]
+    default: Any = MISSING
+    min: int | None = None
+    choices: tuple | None = None
+    non_empty: bool = False
+    coerce: Callable | None = None
+    items: type | None = None
+    max_items: int | None = None
+    schema: "Schema | None" = None
+
+@dataclass(frozen=True, slots=True)
+class Schema:
+    fields: dict[str, Field]
+    variant_key: str | None = None
+    variants: dict[str, dict[str, Field]] = field(default_factory=dict)
+    unique: str | None = None
+    checks: tuple[tuple[Callable[[dict], bool], str], ...] = ()
+
+def _type_name(expected):
+    names = {int: "un intero", float: "un numero", str: "una stringa", list: "una lista", dict: "un oggetto"}
+    if isinstance(expected, tuple):
+        return " o ".join(names.get(t, t.__name__) for t in expected)
+    return names.get(expected, expected.__name__)
+
+def _compile_field(name: str, spec: Field):
+    expected = spec.type
+    nested = compile_record(spec.schema) if spec.schema else None
+
+    def check(record, path, errors):
+        value = record.get(name, spec.default)
+        where = f"{path}.{name}"
+        if value is MISSING:
+            errors.append(f"{where}: campo obbligatorio mancante")
+            return
+        if spec.coerce is not None:
+            try:
+                value = spec.coerce(value)
+            except (TypeError, ValueError):
+                errors.append(f"{where}: {value!r} non è convertibile in {_type_name(expected)}")
+                return
+        if not isinstance(value, expected) or isinstance(value, bool):
+            errors.append(f"{where}: deve essere {_type_name(expected)}")
+            return
+        if spec.non_empty and value == "":
+            errors.append(f"{where}: non può essere una stringa vuota")
+        if spec.min is not None and value < spec.min:
+            errors.append(f"{where}: deve essere maggiore o uguale a {spec.min}")
+        if spec.choices is not None and value not in spec.choices:
+            errors.append(f"{where}: deve essere uno tra {list(spec.choices)}")
+        if spec.max_items is not None and len(value) > spec.max_items:
+            errors.append(f"{where}: può contenere al massimo {spec.max_items} elementi")
+        if spec.items is not None:
+            for i, item in enumerate(value):
+                if not isinstance(item, spec.items):
+                    errors.append(f"{where}[{i}]: deve essere {_type_name(spec.items)}")
+        if nested is not None:
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    nested(item, f"{where}[{i}]", errors)
+            else:
+                nested(value, where, errors)
+
+    return check
+
+def compile_record(schema: Schema):
+    common = [_compile_field(name, spec) for name, spec in schema.fields.items()]
+    variants = {
+        key: [_compile_field(name, spec) for name, spec in fields.items()]
+        for key, fields in schema.variants.items()
+    }
+    checks = schema.checks
+    variant_key = schema.variant_key
+
+    def validate(record, path, errors):
+        if not isinstance(record, dict):
+            errors.append(f"{path}: deve essere un oggetto")
+            return
+        before = len(errors)
+        for check in common:
+            check(record, path, errors)
+        if variant_key is not None:
+            for check in variants.get(record.get(variant_key), ()):
+                check(record, path, errors)
+        if len(errors) == before:
+            for predicate, message in checks:
+                if not predicate(record):
+                    errors.append(f"{path}: {message}")
+
+    return validate
+
+def compile_schema(schema: Schema):
+    validate_record = compile_record(schema)
+    unique = schema.unique
+
+    def validate(records, file_name: str) -> list[str]:
+        errors = []
+        if not isinstance(records, list):
+            return [f"{file_name}: il file deve contenere una lista"]
+        seen = set()
+        for i, record in enumerate(records):
+            label = record.get("name", i) if isinstance(record, dict) else i
+            path = f"{file_name}[{label}]"
+            validate_record(record, path, errors)
+            if unique is not None and isinstance(record, dict):
+                key = record.get(unique)
+                if key in seen:
+                    errors.append(f"{path}: {unique} duplicato")
+                seen.add(key)
+        return errors
+
+    return validate
+
+STAT_FIELDS = {
+    "strength": Field(int, default=0, min=0),
+    "dexterity": Field(int, default=0, min=0),
+    "intelligence": Field(int, default=0, min=0),
+    "defense": Field(int, default=0, min=0)
+}
+STAT_NAMES = ("defense", "strength", "dexterity", "intelligence")
+
+BUFF_SCHEMA = Schema({
+    "name": Field(str, non_empty=True),
+    "stat": Field(str, choices=STAT_NAMES),
+    "amount": Field(int, min=0),
+    "duration": Field(int, min=1)
+})
+
+POISON_SCHEMA = Schema({
+    "name": Field(str, non_empty=True),
+    "damage_per_turn": Field(int, min=1),
+    "duration": Field(int, min=1)
+})
+
+SPECIAL_ABILITY_SCHEMA = Schema({
+    "name": Field(str, default="", non_empty=True),
+    "stat": Field(str, default="", choices=STAT_NAMES),
+    "amount": Field(int, default=0, min=0),
+    "duration": Field(int, default=0, min=1)
+})
+
+CHARACTER_SCHEMA = Schema(
+    {
+        "name": Field(str, non_empty=True),
+        "class": Field(str, choices=("Warrior", "Cleric", "Thief", "Wizard")),
+        "hp": Field(int, min=1),
+        **STAT_FIELDS,
+        "mana": Field(int, default=0, min=1),
+        "mana_per_attack": Field(int, default=0, min=1),
+        "speed": Field(int, default=10, min=1),
+        "special_ability": Field(dict, default={}, schema=SPECIAL_ABILITY_SCHEMA),
+        "potions_set": Field(list, max_items=0),
+        "default_weapon": Field(str, default=""),
+        "default_potions": Field(list, items=str)
+    },
+    variant_key="class",
+    variants={
+        "Warrior": {"shield": Field(int, default=0, min=1)},
+        "Cleric": {
+            "healing_per_attack": Field(int, default=0, min=1),
+            "poison_mitigation": Field(int, default=0, min=1)
+        },
+        "Thief": {"critical_bonus": Field(int, default=0, min=1)},
+        "Wizard": {
+            "buff_amount_boost": Field(int, default=0, min=1),
+            "buff_duration_boost": Field(int, default=0, min=1)
+        }
+    },
+    unique="name"
+)
+
+WEAPON_SCHEMA = Schema(
+    {
+        "name": Field(str, non_empty=True),
+        "weight": Field(int, coerce=int, min=0),
+        **STAT_FIELDS,
+        "damage_range_min": Field(int, min=0),
+        "damage_range_max": Field(int, min=0),
+        "weapon_type": Field(str, choices=("melee", "ranged")),
+        "slot": Field(str, choices=("weapon",))
+    },
+    unique="name",
+    checks=((lambda d: d["damage_range_min"] <= d["damage_range_max"],
+             "il danno minimo non può essere maggiore del danno massimo"),)
+)
+
+MONSTER_SCHEMA = Schema(
+    {
+        "name": Field(str, non_empty=True),
+        "class": Field(str, choices=("Goblin", "Witch", "Spider", "Zombie", "Troll")),
+        "hp": Field(int, min=1),
+        "base_damage": Field(int, min=1),
+        "bonus_damage": Field(int, min=1),
+        "speed": Field(int, min=1)
+    },
+    variant_key="class",
+    variants={
+        "Goblin": {"buff_stole_per_turn": Field(int, min=1)},
+        "Witch": {"poisons": Field(list, schema=POISON_SCHEMA)},
+        "Spider": {"poison": Field(dict, schema=POISON_SCHEMA)},
+        "Troll": {"brute_force": Field(int, min=1)}
+    },
+    unique="name"
+)
+
+POTION_SCHEMA = Schema(
+    {
+        "name": Field(str, non_empty=True),
+        "class": Field(str, choices=("HealPotion", "BuffPotion")),
+        "mana_consume": Field(int, min=0),
+        "uses": Field(int, min=0)
+    },
+    variant_key="class",
+    variants={
+        "HealPotion": {"healing_effect": Field(int, min=1)},
+        "BuffPotion": {"buff": Field(dict, schema=BUFF_SCHEMA)}
+    },
+    unique="name"
+)
+
+PROJECTILE_SCHEMA = Schema(
+    {
+        "weapon": Field(str, non_empty=True),
+        "projectile_type": Field(str, non_empty=True),
+        "speed": Field(int, min=1),
+        "effect": Field(str)
+    },
+    unique="weapon"
+)
+
+SPAWN_ENTRY_SCHEMA = Schema({
+    "monster": Field(str, non_empty=True),
+    "weight": Field((int, float), min=0)
+})
+
+VALIDATORS = {
+    "characters": compile_schema(CHARACTER_SCHEMA),
+    "weapons": compile_schema(WEAPON_SCHEMA),
+    "monsters": compile_schema(MONSTER_SCHEMA),
+    "potions": compile_schema(POTION_SCHEMA),
+    "projectiles": compile_schema(PROJECTILE_SCHEMA)
+}
+_validate_spawn_entries = compile_schema(SPAWN_ENTRY_SCHEMA)
+
+def validate_spawn_tables(data, file_name: str = "spawn_tables") -> list[str]:
+    if not isinstance(data, dict):
+        return [f"{file_name}: il file deve contenere un oggetto"]
+    errors = []
+    tables = {"default": data.get("default", [])}
+    stages = data.get("stages", {})
+    if not isinstance(stages, dict):
+        errors.append(f"{file_name}.stages: deve essere un oggetto")
+        stages = {}
+    for stage, entries in stages.items():
+        if not stage.isdigit():
+            errors.append(f"{file_name}.stages: la fase {stage!r} deve essere un numero")
+            continue
+        tables[f"stages.{stage}"] = entries
+
+    for name, entries in tables.items():
+        table_errors = _validate_spawn_entries(entries, f"{file_name}.{name}")
+        if not table_errors and entries and sum(e["weight"] for e in entries) <= 0:
+            table_errors.append(f"{file_name}.{name}: la somma dei pesi deve essere maggiore di 0")
+        errors.extend(table_errors)
+    return errors
+
+def _names(raw, key):
+    return {d.get("name") for d in raw[key]} if key in raw else None
+
+def _references(raw) -> list[str]:
+    errors = []
+    weapons = _names(raw, "weapons")
+    potions = _names(raw, "potions")
+    monsters = _names(raw, "monsters")
+    for d in raw.get("characters", []):
+        weapon = d.get("default_weapon")
+        if weapons is not None and weapon and weapon not in weapons:
+            errors.append(f"characters[{d['name']}].default_weapon: arma sconosciuta {weapon!r}")
+        if potions is None:
+            continue
+        for potion in d.get("default_potions", []):
+            if potion not in potions:
+                errors.append(f"characters[{d['name']}].default_potions: pozione sconosciuta {potion!r}")
+    if weapons is not None:
+        for p in raw.get("projectiles", []):
+            if p["weapon"] not in weapons:
+                errors.append(f"projectiles[{p['weapon']}]: arma sconosciuta")
+    if monsters is not None and "spawn_tables" in raw:
+        spawn_tables = raw["spawn_tables"]
+        for name, entries in [("default", spawn_tables.get("default", []))] + list(spawn_tables.get("stages", {}).items()):
+            for entry in entries:
+                if entry["monster"] not in monsters:
+                    errors.append(f"spawn_tables.{name}: mostro sconosciuto {entry['monster']!r}")
+    return errors
+
+def validate_catalogs(raw: dict) -> None:
+    errors = []
+    for key, validator in VALIDATORS.items():
+        if key in raw:
+            errors.extend(validator(raw[key], key))
+    if "spawn_tables" in raw:
+        errors.extend(validate_spawn_tables(raw["spawn_tables"]))
+    if not errors:
+        errors.extend(_references(raw))
+    if errors:
+        raise DataValidationError(errors)
+
+def validate_monster(data: dict) -> None:
+    errors = VALIDATORS["monsters"]([data], "monsters")
+    if errors:
+        raise DataValidationError(errors)
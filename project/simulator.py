@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+
+from characters import Character
+from monsters import Monster
+from rng import BattleRng, default_rng
+
+@dataclass
+class BattleResult:
+    winner: str | None
+    rounds: int
+    hero_hp: int
+    monster_hp: int
+
+    @property
+    def hero_won(self) -> bool:
+        return self.winner == "hero"
+
+class BattleSimulator:
+    """Esegue le battaglie sui modelli reali, un round alla volta (decine di migliaia di battaglie al secondo).
+    Per simulazioni da centinaia di migliaia di battaglie al secondo usare batch_engine.BatchBattle."""
+    def __init__(self, max_rounds: int = 500, use_special_ability: bool = True):
+        if not isinstance(max_rounds, int):
+            raise TypeError("Il numero massimo di round deve essere un intero")
+        if max_rounds <= 0:
+            raise ValueError("Il numero massimo di round deve essere maggiore di 0")
+        if not isinstance(use_special_ability, bool):
+            raise TypeError("L'utilizzo dell'abilità speciale deve essere un booleano")
+        self.max_rounds = max_rounds
+        self.use_special_ability = use_special_ability
+
+    def run(self, hero: Character, monster: Monster, rng: BattleRng | None = None) -> BattleResult:
+        rng = rng or default_rng()
+        special = self.use_special_ability and not hero.used_special_ability
+        max_rounds = self.max_rounds
+        start_turn = hero.start_turn
+        end_round = hero.end_round
+        hero_attack = hero.attack
+        monster_attack = monster.attack
+        rounds = 0
+
+        while rounds < max_rounds:
+            rounds += 1
+            start_turn()
+
+            if special:
+                hero.add_buff(hero.special_ability)
+                hero.used_special_ability = True
+                special = False
+            else:
+                hero_attack(monster, rng)
+
+            if monster.hp <= 0:
+                end_round()
+                hero.used_special_ability = False
+                return BattleResult("hero", rounds, hero.hp, 0)
+
+            monster_attack(hero, rng)
+            end_round()
+
+            if hero.hp <= 0:
+                return BattleResult("monster", rounds, 0, monster.hp)
+
+        return BattleResult(None, rounds, hero.hp, monster.hp)
+
+    def run_many(self, hero: Character, monster: Monster, battles: int, seed: int | str | None = None, start: int = 0) -> list[BattleResult]:
+        if not isinstance(battles, int) or not isinstance(start, int):
+            raise TypeError("Il numero di battaglie e l'indice iniziale devono essere interi")
+        if battles < 0 or start < 0:
+            raise ValueError("Il numero di battaglie e l'indice iniziale non possono essere negativi")
+        run = self.run
+        rng = BattleRng(seed)
+        results = []
+        for index in range(start, start + battles):
+            hero.reset()
+            monster.reset()
+            results.append(run(hero, monster, rng.stream(index)))
+        return results
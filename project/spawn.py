@@ -0,0 +1,94 @@
+from array import array
+from typing import Generic, Sequence, TypeVar
+
+import numpy as np
+
+from project.rng import UNIT, BattleRng, default_rng
+
+T = TypeVar("T")
+
+class AliasTable(Generic[T]):
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("Elementi e pesi devono avere la stessa lunghezza")
+        if not items:
+            raise ValueError("La tabella deve contenere almeno un elemento")
+        for weight in weights:
+            if not isinstance(weight, (int, float)) or isinstance(weight, bool):
+                raise TypeError("I pesi devono essere numeri")
+            if weight < 0:
+                raise ValueError("I pesi non possono essere negativi")
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("La somma dei pesi deve essere maggiore di 0")
+
+        n = len(items)
+        self.items = list(items)
+        self.prob = array("d", [0.0]) * n
+        self.alias = array("L", [0]) * n
+
+        scaled = [weight * n / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+            self.alias[i] = i
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample_index(self, rng: BattleRng | None = None) -> int:
+        u = (rng or default_rng()).random() * len(self.items)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def sample(self, rng: BattleRng | None = None) -> T:
+        return self.items[self.sample_index(rng)]
+
+    def sample_indices(self, count: int, rng: BattleRng | None = None):
+        if not isinstance(count, int):
+            raise TypeError("Il numero di estrazioni deve essere un intero")
+        if count < 0:
+            raise ValueError("Il numero di estrazioni non può essere negativo")
+        words = np.frombuffer((rng or default_rng()).words(count), dtype=np.uint64)
+        u = (words >> np.uint64(11)) * UNIT * len(self.items)
+        columns = u.astype(np.int64)
+        prob = np.frombuffer(self.prob, dtype=np.float64)
+        alias = np.frombuffer(self.alias, dtype=np.uint64 if self.alias.itemsize == 8 else np.uint32)
+        return np.where(u - columns < prob[columns], columns, alias[columns].astype(np.int64))
+
+    def sample_many(self, count: int, rng: BattleRng | None = None) -> list[T]:
+        items = self.items
+        return [items[i] for i in self.sample_indices(count, rng).tolist()]
+
+class SpawnTables:
+    def __init__(self, default: AliasTable[str] | None = None, stages: dict[int, AliasTable[str]] | None = None):
+        self.default = default
+        self.stages = stages or {}
+
+    def __bool__(self):
+        return self.default is not None or bool(self.stages)
+
+    @staticmethod
+    def compile_table(entries: list[dict], monsters=None) -> AliasTable[str]:
+        names = [entry["monster"] for entry in entries]
+        if monsters is not None:
+            unknown = [name for name in names if name not in monsters]
+            if unknown:
+                raise ValueError(f"Mostri sconosciuti nella tabella di spawn: {unknown}")
+        return AliasTable(names, [entry["weight"] for entry in entries])
+
+    @classmethod
+    def from_data(cls, data: dict, monsters=None) -> "SpawnTables":
+        default = cls.compile_table(data["default"], monsters) if data.get("default") else None
+        stages = {int(stage): cls.compile_table(entries, monsters) for stage, entries in data.get("stages", {}).items()}
+        return cls(default, stages)
+
+    def table_for(self, stage: int | None = None) -> AliasTable[str] | None:
+        return self.stages.get(stage, self.default)
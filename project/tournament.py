@@ -0,0 +1,125 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator
+
+from project.data_manager import DataManager
+from project.factory import GameFactory
+from project.schemas import validate_catalogs
+from project.simulator import BattleSimulator
+
+@dataclass
+class MatchupStats:
+    hero: str
+    monster: str
+    level: int
+    battles: int = 0
+    hero_wins: int = 0
+    draws: int = 0
+    kill_rounds: int = 0
+
+    @property
+    def win_rate(self) -> float:
+        if self.battles == 0:
+            return 0.0
+        return self.hero_wins / self.battles
+
+    @property
+    def turns_to_kill(self) -> float | None:
+        if self.hero_wins == 0:
+            return None
+        return self.kill_rounds / self.hero_wins
+
+    def merge(self, other: "MatchupStats") -> None:
+        if (self.hero, self.monster, self.level) != (other.hero, other.monster, other.level):
+            raise ValueError("Si possono unire solo statistiche dello stesso incontro")
+        self.battles += other.battles
+        self.hero_wins += other.hero_wins
+        self.draws += other.draws
+        self.kill_rounds += other.kill_rounds
+
+_worker_catalog = None
+
+def _init_worker(characters, weapons, monsters, max_rounds):
+    global _worker_catalog
+    weapon_map = {w["name"]: GameFactory.create_weapon(w, trusted=True) for w in weapons}
+    _worker_catalog = (characters, weapon_map, monsters, BattleSimulator(max_rounds))
+
+def _run_shard(task):
+    hero_index, monster_index, level, start, battles, seed = task
+    characters, weapon_map, monsters, simulator = _worker_catalog
+    hero_data = characters[hero_index]
+    monster_data = monsters[monster_index]
+    weapon = weapon_map.get(hero_data.get("default_weapon"))
+
+    hero = GameFactory.create_character(hero_data, trusted=True)
+    if weapon is not None:
+        hero.equip(weapon)
+    monster = GameFactory.create_monster(monster_data, level, trusted=True)
+
+    stats = MatchupStats(hero_data["name"], monster_data["name"], level)
+    for result in simulator.run_many(hero, monster, battles, seed, start):
+        stats.battles += 1
+        if result.winner == "hero":
+            stats.hero_wins += 1
+            stats.kill_rounds += result.rounds
+        elif result.winner is None:
+            stats.draws += 1
+    return stats
+
+class Tournament:
+    def __init__(self, characters: list[dict], weapons: list[dict], monsters: list[dict], levels: int = 3, battles: int = 1000, shard_size: int = 250, seed: int = 0, workers: int | None = None, max_rounds: int = 500):
+        if not isinstance(levels, int) or not isinstance(battles, int) or not isinstance(shard_size, int):
+            raise TypeError("Livelli, battaglie e dimensione dei blocchi devono essere interi")
+        if levels <= 0 or battles <= 0 or shard_size <= 0:
+            raise ValueError("Livelli, battaglie e dimensione dei blocchi devono essere maggiori di 0")
+        validate_catalogs({"characters": characters, "weapons": weapons, "monsters": monsters})
+        self.characters = characters
+        self.weapons = weapons
+        self.monsters = monsters
+        self.levels = levels
+        self.battles = battles
+        self.shard_size = shard_size
+        self.seed = seed
+        self.workers = workers or os.cpu_count() or 1
+        self.max_rounds = max_rounds
+
+    @classmethod
+    def from_data_files(cls, **kwargs) -> "Tournament":
+        catalogs = DataManager.load_catalogs()
+        return cls(catalogs["characters"], catalogs["weapons"], catalogs["monsters"], **kwargs)
+
+    def matchup_seed(self, hero_index, monster_index, level) -> str:
+        return f"{self.seed}:{hero_index}:{monster_index}:{level}"
+
+    def shards(self) -> Iterator[tuple]:
+        for hero_index in range(len(self.characters)):
+            for monster_index in range(len(self.monsters)):
+                for level in range(1, self.levels + 1):
+                    seed = self.matchup_seed(hero_index, monster_index, level)
+                    for start in range(0, self.battles, self.shard_size):
+                        battles = min(self.shard_size, self.battles - start)
+                        yield hero_index, monster_index, level, start, battles, seed
+
+    def iter_results(self) -> Iterator[MatchupStats]:
+        initargs = (self.characters, self.weapons, self.monsters, self.max_rounds)
+        with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=initargs) as executor:
+            futures = [executor.submit(_run_shard, task) for task in self.shards()]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def run(self) -> dict[tuple[str, str, int], MatchupStats]:
+        matrix = {}
+        for stats in self.iter_results():
+            key = (stats.hero, stats.monster, stats.level)
+            if key in matrix:
+                matrix[key].merge(stats)
+            else:
+                matrix[key] = stats
+        return matrix
+
+if __name__ == "__main__":
+    results = Tournament.from_data_files().run()
+    for (hero, monster, level), stats in sorted(results.items()):
+        turns = "-" if stats.turns_to_kill is None else f"{stats.turns_to_kill:.2f}"
+        print(f"{hero:20} {monster:10} lv {level}: win rate {stats.win_rate:.3f}, turns to kill {turns}")
@@ -1,11 +1,13 @@
 import math
 import os
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from project.assets_manager import AssetsManager
 from project.game_state import GameState
 from project.items import ArmorPiece
 from project.potions import Potion
+from project.profiler import FrameProfiler
 
 PLAYER_START_POS = (200, 400)
 ENEMY_START_POS = (600, 400)
@@ -18,8 +20,7 @@ class SpriteState(Enum):
 
 class Button:
     def __init__(self, pos, filename, scale):
-        self.image = pygame.image.load(filename).convert_alpha()
-        self.image = pygame.transform.scale(self.image, scale)
+        self.image = AssetsManager.get_surface(filename, scale)
         self.rect = self.image.get_rect(center=pos)
 
         self.is_active = True
@@ -42,6 +43,9 @@ class Button:
     def update(self):
         self.clicked = False
 
+    def blits(self):
+        return [(self.image, self.rect)]
+
     def draw(self, screen):
         screen.blit(self.image, self.rect)
 
@@ -51,55 +55,64 @@ class Card:
     PADDING = 10
 
     def __init__(self, card_image_path: str, content_image_path: str | None, model, center_pos: tuple[float, float],
-                 font=None):
+                 font: tuple[str | None, int] | None = None):
         self.model = model
         self.font = font
+        self._text_key = None
+        self._text_blits = []
 
-        raw_card_image = pygame.image.load(card_image_path).convert_alpha()
-        self.card_image = pygame.transform.smoothscale(raw_card_image, (self.WIDTH, self.HEIGHT))
+        self.card_image = AssetsManager.get_surface(card_image_path, (self.WIDTH, self.HEIGHT), "smoothscale")
         self.card_rect = self.card_image.get_rect(center=center_pos)
 
         self.content_image = None
         self.content_rect = None
 
         if content_image_path:
-            raw_content_image = pygame.image.load(content_image_path).convert_alpha()
-            max_width = self.WIDTH - self.PADDING * 2
-            max_height = self.HEIGHT - self.PADDING * 2
-            scale = min(max_width / raw_content_image.get_width(), max_height / raw_content_image.get_height())
-            new_size = (int(raw_content_image.get_width() * scale), int(raw_content_image.get_height() * scale))
-
-            self.content_image = pygame.transform.smoothscale(raw_content_image, new_size)
+            self.content_image = AssetsManager.get_surface(content_image_path, self.content_size(), "fit")
             self.content_rect = self.content_image.get_rect(center=self.card_rect.center)
 
-    def draw(self, screen):
-        screen.blit(self.card_image, self.card_rect)
+    @classmethod
+    def content_size(cls):
+        return cls.WIDTH - cls.PADDING * 2, cls.HEIGHT - cls.PADDING * 2
+
+    def blits(self):
+        blits = [(self.card_image, self.card_rect)]
         if self.content_image:
-            screen.blit(self.content_image, self.content_rect)
+            blits.append((self.content_image, self.content_rect))
 
         if self.font and self.model:
-            self._draw_text_info(screen)
+            blits.extend(self._text_info_blits())
+        return blits
+
+    def draw(self, screen):
+        screen.blits(self.blits(), False)
+
+    def _text_info_blits(self):
+        key = (id(self.model), self.model.name, getattr(self.model, "hp", None), getattr(self.model, "mana", None))
+        if key != self._text_key:
+            self._text_key = key
+            self._text_blits = self._render_text_info()
+        return self._text_blits
 
-    def _draw_text_info(self, screen):
-        font_small = pygame.font.Font(None, int(self.font.get_height() * 0.6))
+    def _render_text_info(self):
+        name, size = self.font
+        small_size = int(AssetsManager.get_font(name, size).get_height() * 0.6)
+        blits = []
 
-        name_surface = self.font.render(self.model.name, True, (0, 0, 0))
-        name_rect = name_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.top + 40))
-        screen.blit(name_surface, name_rect)
+        name_surface = AssetsManager.render_text(name, size, self.model.name)
+        blits.append((name_surface, name_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.top + 40))))
 
-        class_name_text = self.model.__class__.__name__
-        class_name_surface = font_small.render(class_name_text, True, (0, 0, 0))
-        cls_rect = class_name_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.top + 82))
-        screen.blit(class_name_surface, cls_rect)
+        class_name_surface = AssetsManager.render_text(None, small_size, self.model.__class__.__name__)
+        blits.append((class_name_surface, class_name_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.top + 82))))
 
         if hasattr(self.model, "hp"):
-            hp_surface = font_small.render(f"HP: {self.model.hp}", True, (0, 0, 0))
-            screen.blit(hp_surface, hp_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.bottom - 42)))
+            hp_surface = AssetsManager.render_text(None, small_size, f"HP: {self.model.hp}")
+            blits.append((hp_surface, hp_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.bottom - 42))))
 
         if hasattr(self.model, "mana"):
-            mana_surface = font_small.render(f"MANA: {self.model.mana}", True, (0, 0, 0))
-            screen.blit(mana_surface,
-                        mana_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.bottom - 25)))
+            mana_surface = AssetsManager.render_text(None, small_size, f"MANA: {self.model.mana}")
+            blits.append((mana_surface, mana_surface.get_rect(center=(self.card_rect.centerx, self.card_rect.bottom - 25))))
+        return blits
 
     def is_clicked(self, mouse_pos):
         return self.card_rect.collidepoint(mouse_pos)
@@ -126,17 +139,18 @@ class InventoryCard(Card):
 
     def load_images(self):
         if self.asset_image_path:
-            raw = pygame.image.load(self.asset_image_path).convert_alpha()
-            self.asset_image = pygame.transform.smoothscale(raw, (self.WIDTH, self.HEIGHT))
+            self.asset_image = AssetsManager.get_surface(self.asset_image_path, (self.WIDTH, self.HEIGHT), "smoothscale")
             self.asset_rect = self.asset_image.get_rect(center=self.card_rect.center)
+        self.load_item_image()
 
+    @classmethod
+    def item_size(cls):
+        return cls.WIDTH - 10, cls.HEIGHT - 10
+
+    def load_item_image(self):
         if self.item_image_path:
             try:
-                raw = pygame.image.load(self.item_image_path).convert_alpha()
-                max_w, max_h = self.WIDTH - 10, self.HEIGHT - 10
-                scale = min(max_w / raw.get_width(), max_h / raw.get_height())
-                self.item_image = pygame.transform.smoothscale(raw, (
-                int(raw.get_width() * scale), int(raw.get_height() * scale)))
+                self.item_image = AssetsManager.get_surface(self.item_image_path, self.item_size(), "fit")
                 self.item_rect = self.item_image.get_rect(center=self.card_rect.center)
             except Exception as e:
                 print(f"Error loading item image: {e}")
@@ -144,48 +158,96 @@ class InventoryCard(Card):
         else:
             self.item_image = None
 
+    def set_item(self, item, item_image_path) -> bool:
+        if item is self.model and item_image_path == self.item_image_path:
+            return False
+        self.model = item
+        self.item_image_path = item_image_path
+        self.load_item_image()
+        return True
+
     def check_collide(self, mouse_pos, selected_hero):
         if self.is_clicked(mouse_pos) and isinstance(self.model, Potion):
             self.model.use(selected_hero)
             return True
         return False
 
-    def draw(self, screen):
-        if self.asset_image: screen.blit(self.asset_image, self.asset_rect)
-        if self.item_image: screen.blit(self.item_image, self.item_rect)
+    def blits(self):
+        blits = []
+        if self.asset_image: blits.append((self.asset_image, self.asset_rect))
+        if self.item_image: blits.append((self.item_image, self.item_rect))
+        return blits
 
 class EffectSprite(pygame.sprite.Sprite):
+    kind = "effect"
     SIZE_X = 100
     SIZE_Y = 100
     DURATION = 1.0
+    FREE_LIMIT = 8
+
+    _free = {}
 
     def __init__(self, image_name: str, pos: tuple):
         super().__init__()
+        self.image_name = image_name
         path = AssetsManager.asset_path("..", "assets", "effect", f"{image_name}.png")
-        self.image = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.SIZE_X, self.SIZE_Y))
+        self.image = AssetsManager.get_surface(path, (self.SIZE_X, self.SIZE_Y))
         self.rect = self.image.get_rect(center=pos)
         self.timer = 0
 
+    @classmethod
+    def spawn(cls, image_name: str, pos: tuple) -> "EffectSprite":
+        free = cls._free.get(image_name)
+        if not free:
+            return cls(image_name, pos)
+        effect = free.pop()
+        effect.rect.center = pos
+        effect.timer = 0
+        return effect
+
+    def release(self):
+        self.kill()
+        free = self._free.setdefault(self.image_name, [])
+        if len(free) < self.FREE_LIMIT:
+            free.append(self)
+
+    @classmethod
+    def clear_free(cls):
+        cls._free.clear()
+
     def update(self, dt):
         self.timer += dt
         if self.timer > self.DURATION:
-            self.kill()
+            self.release()
 
 class ProjectileSprite(pygame.sprite.Sprite):
+    kind = "projectile"
     SIZE_X = 60
     SIZE_Y = 60
+    FREE_LIMIT = 8
+
+    _free = {}
 
     def __init__(self, image_name: str, start_pos: tuple, target_sprite, speed: int, effect_name: str):
         super().__init__()
+        self.image_name = image_name
+        self.path = AssetsManager.asset_path("..", "assets", "projectile", f"{image_name}.png")
+        self.reset(start_pos, target_sprite, speed, effect_name)
+
+    @classmethod
+    def spawn(cls, image_name: str, start_pos: tuple, target_sprite, speed: int, effect_name: str) -> "ProjectileSprite":
+        free = cls._free.get(image_name)
+        if not free:
+            return cls(image_name, start_pos, target_sprite, speed, effect_name)
+        projectile = free.pop()
+        projectile.reset(start_pos, target_sprite, speed, effect_name)
+        return projectile
+
+    def reset(self, start_pos: tuple, target_sprite, speed: int, effect_name: str):
         self.target_sprite = target_sprite
         self.effect_name = effect_name
         self.speed = speed
 
-        path = AssetsManager.asset_path("..", "assets", "projectile", f"{image_name}.png")
-        self.image = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.SIZE_X, self.SIZE_Y))
-
         self.current_x, self.current_y = float(start_pos[0]), float(start_pos[1])
 
         tx, ty = target_sprite.rect.center
@@ -196,9 +258,20 @@ class ProjectileSprite(pygame.sprite.Sprite):
         self.dir_y = dy / dist if dist != 0 else 0
 
         angle = math.degrees(math.atan2(-self.dir_y, self.dir_x))
-        self.image = pygame.transform.rotate(self.image, angle)
+        self.image = AssetsManager.get_rotated(self.path, (self.SIZE_X, self.SIZE_Y), angle)
         self.rect = self.image.get_rect(center=(int(self.current_x), int(self.current_y)))
 
+    def release(self):
+        self.kill()
+        self.target_sprite = None
+        free = self._free.setdefault(self.image_name, [])
+        if len(free) < self.FREE_LIMIT:
+            free.append(self)
+
+    @classmethod
+    def clear_free(cls):
+        cls._free.clear()
+
     def update(self, dt):
         self.current_x += self.dir_x * self.speed * dt
         self.current_y += self.dir_y * self.speed * dt
@@ -209,10 +282,10 @@ class ProjectileSprite(pygame.sprite.Sprite):
 
     def on_impact(self):
         if self.effect_name:
-            effect = EffectSprite(self.effect_name, self.target_sprite.rect.center)
+            effect = EffectSprite.spawn(self.effect_name, self.target_sprite.rect.center)
             for group in self.groups():
                 group.add(effect)
-        self.kill()
+        self.release()
 
 class BaseSprite(pygame.sprite.Sprite):
     BAR_WIDTH = 60
@@ -223,15 +296,28 @@ class BaseSprite(pygame.sprite.Sprite):
     ATTACK_DURATION = 0.8
     WALK_INTERVAL = 0.2
     RETURN_INTERVAL = 1.0
+    SIZE_SCALES = {"Troll": 1.5}
+
+    _bar_surfaces = {}
 
-    def __init__(self, model, coordinates: tuple[int, int], frames: dict):
+    def __init__(self, model, coordinates: tuple[int, int], frames: dict, rng=None, kind: str = "hero"):
         super().__init__()
+        self.kind = kind
 
-        if model.name == "Troll":
-            self.SIZE_X = int(self.SIZE_X * 1.5)
-            self.SIZE_Y = int(self.SIZE_Y * 1.5)
+        if model.name in self.SIZE_SCALES:
+            self.SIZE_X = int(self.SIZE_X * self.SIZE_SCALES[model.name])
+            self.SIZE_Y = int(self.SIZE_Y * self.SIZE_SCALES[model.name])
 
+        self.frames = {}
+
+        for k, path in frames.items():
+            self.frames[k] = AssetsManager.get_surface(path, (self.SIZE_X, self.SIZE_Y))
+
+        self.reset(model, coordinates, rng)
+
+    def reset(self, model, coordinates: tuple[int, int], rng=None):
         self.model = model
+        self.rng = rng
         self.speed_pixel = model.speed * 20
         self.is_ranged_attack = False
 
@@ -243,12 +329,6 @@ class BaseSprite(pygame.sprite.Sprite):
         self.walk_toggle = False
 
         self.start_position = coordinates
-        self.frames = {}
-
-        for k, path in frames.items():
-            img = pygame.image.load(path).convert_alpha()
-            self.frames[k] = pygame.transform.scale(img, (self.SIZE_X, self.SIZE_Y))
-
         self.image = self.frames["idle"]
         self.rect = self.image.get_rect(midbottom=self.start_position)
 
@@ -266,20 +346,38 @@ class BaseSprite(pygame.sprite.Sprite):
 
     def _spawn_projectile(self, target, data, group):
         start_pos = self.rect.center
-        projectile = ProjectileSprite(data['name'], start_pos, target, data['speed'], data['effect'])
+        projectile = ProjectileSprite.spawn(data['name'], start_pos, target, data['speed'], data['effect'])
         self.image = self.frames["attack"]
         if group:
             group.add(projectile)
 
-    def draw_hp_bar(self, surface):
-        if self.model.max_hp <= 0: return
+    @staticmethod
+    def _bar_surface(width, height, color):
+        key = (width, height, color)
+        bar = BaseSprite._bar_surfaces.get(key)
+        if bar is None:
+            bar = pygame.Surface((width, height))
+            bar.fill(color)
+            BaseSprite._bar_surfaces[key] = bar
+        return bar
+
+    def hp_bar_blits(self):
+        if self.model.max_hp <= 0: return []
         ratio = max(0, self.model.hp / self.model.max_hp)
 
         bx = self.rect.centerx - self.BAR_WIDTH // 2
         by = self.rect.top - 10
 
-        pygame.draw.rect(surface, (180, 0, 0), (bx, by, self.BAR_WIDTH, self.BAR_HEIGHT))
-        pygame.draw.rect(surface, (0, 200, 0), (bx, by, int(self.BAR_WIDTH * ratio), self.BAR_HEIGHT))
+        blits = [(self._bar_surface(self.BAR_WIDTH, self.BAR_HEIGHT, (180, 0, 0)),
+                  pygame.Rect(bx, by, self.BAR_WIDTH, self.BAR_HEIGHT))]
+        green_width = min(self.BAR_WIDTH, int(self.BAR_WIDTH * ratio))
+        if green_width > 0:
+            blits.append((self._bar_surface(green_width, self.BAR_HEIGHT, (0, 200, 0)),
+                          pygame.Rect(bx, by, green_width, self.BAR_HEIGHT)))
+        return blits
+
+    def draw_hp_bar(self, surface):
+        surface.blits(self.hp_bar_blits(), False)
 
     def update(self, dt):
         if self.state == SpriteState.IDLE:
@@ -313,7 +411,7 @@ class BaseSprite(pygame.sprite.Sprite):
         self.timer += dt
         if self.timer >= self.ATTACK_DURATION:
             if self.target and self.target.model.hp > 0:
-                self.model.attack(self.target.model)
+                self.model.attack(self.target.model, self.rng)
 
             self.target = None
             self.timer = 0
@@ -332,29 +430,134 @@ class BaseSprite(pygame.sprite.Sprite):
             self.image = self.frames["idle"]
             self.return_timer = 0
 
+class SpritePool:
+    def __init__(self):
+        self._free = {}
+
+    @staticmethod
+    def _key(model):
+        return model.__class__.__name__, model.name
+
+    def acquire(self, model, coordinates: tuple[int, int], rng=None) -> BaseSprite:
+        free = self._free.get(self._key(model))
+        if free:
+            sprite = free.pop()
+            sprite.reset(model, coordinates, rng)
+            return sprite
+        return BaseSprite(model, coordinates, AssetsManager.get_frames_for_character(model), rng, kind="enemy")
+
+    def release(self, sprite: BaseSprite) -> None:
+        sprite.kill()
+        sprite.target = None
+        self._free.setdefault(self._key(sprite.model), []).append(sprite)
+
+class SpriteRegistry(pygame.sprite.Group):
+    KINDS = ("hero", "enemy", "projectile", "effect")
+
+    def __init__(self, *sprites):
+        self._by_kind = {kind: {} for kind in self.KINDS}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        kind = getattr(sprite, "kind", None)
+        if kind not in self._by_kind:
+            raise ValueError(f"Tipo di sprite sconosciuto: {kind}")
+        super().add_internal(sprite, layer)
+        self._by_kind[kind][sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._by_kind[sprite.kind].pop(sprite, None)
+
+    def of_kind(self, kind: str) -> list:
+        return list(self._by_kind[kind])
+
+    def count(self, kind: str) -> int:
+        return len(self._by_kind[kind])
+
+    def has(self, kind: str) -> bool:
+        return bool(self._by_kind[kind])
+
+    def update_kind(self, kind: str, *args, **kwargs) -> None:
+        for sprite in list(self._by_kind[kind]):
+            sprite.update(*args, **kwargs)
+
+    def counts(self) -> dict[str, int]:
+        return {kind: len(sprites) for kind, sprites in self._by_kind.items()}
+
+class DirtyRenderer:
+    def __init__(self, screen, profiler=None):
+        self.screen = screen
+        self.profiler = profiler if profiler is not None else FrameProfiler(enabled=False)
+        self.background = None
+        self.full_redraws = 0
+        self.dirty_rects = []
+        self._keys = set()
+
+    def invalidate(self) -> None:
+        self.background = None
+
+    def render(self, background, blits) -> list[pygame.Rect]:
+        keys = {(id(image), tuple(rect)) for image, rect in blits}
+
+        if background is not self.background:
+            self.background = background
+            self.screen.blit(background, (0, 0))
+            self.screen.blits(blits, False)
+            with self.profiler.phase("present"):
+                pygame.display.flip()
+            self.full_redraws += 1
+            self.dirty_rects = [self.screen.get_rect()]
+        else:
+            self.dirty_rects = [pygame.Rect(rect) for _, rect in keys ^ self._keys]
+            for dirty in self.dirty_rects:
+                self.screen.set_clip(dirty)
+                self.screen.blit(background, dirty, dirty)
+                self.screen.blits([b for b in blits if dirty.colliderect(b[1])], False)
+            self.screen.set_clip(None)
+            if self.dirty_rects:
+                with self.profiler.phase("present"):
+                    pygame.display.update(self.dirty_rects)
+
+        self._keys = keys
+        return self.dirty_rects
+
 class UIManager:
     NUMBER_OF_BACKGROUNDS = 9
-    def __init__(self, width, height):
+    BUTTON_SIZE = (200, 200)
+    PROFILER_REFRESH = 30
+
+    def __init__(self, width, height, dirty_rendering=True, profiler=None):
         pygame.init()
         self.WIDTH = width
         self.HEIGHT = height
         self.screen = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         pygame.display.set_caption("Code Combat")
         self.screen_rect = self.screen.get_rect()
+        self.dirty_rendering = dirty_rendering
+        self.profiler = profiler if profiler is not None else FrameProfiler(enabled=False)
+        self.renderer = DirtyRenderer(self.screen, self.profiler)
+        self.show_profiler = False
+        self._profiler_text = None
 
         self.font = self._load_font()
-        self.backgrounds = []
-        self._load_backgrounds("bg")
-
-        self.background = self.backgrounds[0]
+        self.title_text = AssetsManager.render_text(*self.font, "SELECT YOUR CHARACTER:")
+        self.title_rect = self.title_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery - 150))
+        self.background_paths = self._background_paths("bg")
+        self._background_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="background")
+        self._next_background = None
+
+        self.stage = 1
+        self.background = self._load_background_image(os.path.basename(self.background_paths[0]), "bg")
+        self._prefetch_background()
         self.is_over = False
         self.bg_selection = self._load_background_image("menu_wooden_board.jpg")
 
         self.character_cards = []
         self.inventory_cards = []
 
-        self.attack_button = Button((100, 530), AssetsManager.asset_path("..", "assets", "buttons", "attack.png"), (200, 200))
-        self.special_ability_button = Button((700, 530), AssetsManager.asset_path("..", "assets", "buttons", "special.png"), (200, 200))
+        self.attack_button = Button((100, 530), AssetsManager.asset_path("..", "assets", "buttons", "attack.png"), self.BUTTON_SIZE)
+        self.special_ability_button = Button((700, 530), AssetsManager.asset_path("..", "assets", "buttons", "special.png"), self.BUTTON_SIZE)
 
     def handle_ui_event(self, event):
         self.attack_button.handle_event(event)
@@ -363,30 +566,46 @@ class UIManager:
     @staticmethod
     def _load_font():
         path = AssetsManager.asset_path("..", "assets", "font", "selection_font.ttf")
-        return pygame.font.Font(path, 36) if os.path.exists(path) else pygame.font.SysFont("Arial", 36)
+        return (path if os.path.exists(path) else pygame.font.match_font("arial"), 36)
 
     def _load_background_image(self, filename, subfolder=None):
         if subfolder:
             path = AssetsManager.asset_path("..", "assets", subfolder, filename)
         else:
             path = AssetsManager.asset_path("..", "assets", filename)
-        img = pygame.image.load(path).convert_alpha()
-        return pygame.transform.scale(img, (self.WIDTH, self.HEIGHT))
+        return AssetsManager.get_surface(path, (self.WIDTH, self.HEIGHT))
 
-    def _load_backgrounds(self, subfolder=None):
-        for i in range(self.NUMBER_OF_BACKGROUNDS):
-            bg = self._load_background_image(
-                f"sfondo_{i + 1}.png",
-                subfolder=subfolder
-            )
-            self.backgrounds.append(bg)
+    def _background_paths(self, subfolder):
+        return [
+            AssetsManager.asset_path("..", "assets", subfolder, f"sfondo_{i + 1}.png")
+            for i in range(self.NUMBER_OF_BACKGROUNDS)
+        ]
+
+    def _prefetch_background(self):
+        if not self.background_paths:
+            self._next_background = None
+            return
+        path = self.background_paths[0]
+        future = self._background_loader.submit(AssetsManager.decode_surface, path, (self.WIDTH, self.HEIGHT))
+        self._next_background = (path, future)
 
     def refresh_background(self):
-        if not self.backgrounds:
+        if not self.background_paths:
             self.is_over = True
             return
-        self.background = self.backgrounds[0]
-        self.backgrounds.remove(self.backgrounds[0])
+        path = self.background_paths.pop(0)
+        self.stage = max(1, self.NUMBER_OF_BACKGROUNDS - len(self.background_paths))
+        if self._next_background and self._next_background[0] == path:
+            decoded = self._next_background[1].result()
+            self.background = AssetsManager.get_surface(path, (self.WIDTH, self.HEIGHT), decoded=decoded)
+        else:
+            self.background = AssetsManager.get_surface(path, (self.WIDTH, self.HEIGHT))
+        self._prefetch_background()
+
+    def close(self):
+        self._background_loader.shutdown(wait=True, cancel_futures=True)
+        ProjectileSprite.clear_free()
+        EffectSprite.clear_free()
 
     def create_character_selection_screen(self, characters):
         self.character_cards.clear()
@@ -418,39 +637,42 @@ class UIManager:
 
         for i in range(num_cards):
             pos = (start_x + i * card_w, center_y)
-            card = InventoryCard(bg_path, bg_path, None, pos, self.font)
-            card.item_image_path = None
-            card.load_images()
-            self.inventory_cards.append(card)
+            self.inventory_cards.append(InventoryCard(bg_path, bg_path, None, pos, self.font))
+
+    @staticmethod
+    def _item_image_path(item):
+        if hasattr(item, "weapon_type"):
+            folder = "weapon"
+        elif isinstance(item, ArmorPiece):
+            folder = "armor"
+        else:
+            folder = "potions"
+        return AssetsManager.asset_path("..", "assets", folder, f"{item.name}.png")
 
-    def update_inventory(self, hero):
+    def update_inventory(self, hero) -> list[InventoryCard]:
         equipment_items = [item for item in hero.equipment.values() if item]
-        potion_items = list(hero.potions_set)
-
-        all_items = equipment_items + potion_items
-        all_items = all_items[:5]
-
-        while len(all_items) < 5:
-            all_items.append(None)
-
-        for i, card in enumerate(self.inventory_cards):
-            item = all_items[i]
-            card.model = item
-            card.asset_image_path = AssetsManager.asset_path("..", "assets", "wooden_board.png")
-            if item:
-                if hasattr(item, "weapon_type"):
-                    folder = "weapon"
-                elif isinstance(item, ArmorPiece):
-                    folder = "armor"
-                else:
-                    folder = "potions"
-
-                card.item_image_path = AssetsManager.asset_path(
-                    "..", "assets", folder, f"{item.name}.png"
-                )
-            else:
-                card.item_image_path = None
-            card.load_images()
+        all_items = equipment_items + list(hero.potions_set)
+        present = {id(item) for item in all_items}
+
+        changed = []
+        for card in self.inventory_cards:
+            if card.model is not None and id(card.model) not in present:
+                card.set_item(None, None)
+                changed.append(card)
+
+        placed = {id(card.model) for card in self.inventory_cards if card.model is not None}
+        free_cards = (card for card in self.inventory_cards if card.model is None)
+        for item in all_items:
+            if id(item) in placed:
+                continue
+            card = next(free_cards, None)
+            if card is None:
+                break
+            card.set_item(item, self._item_image_path(item))
+            placed.add(id(item))
+            if card not in changed:
+                changed.append(card)
+        return changed
 
     def handle_selection_click(self, mouse_pos):
         for card in self.character_cards:
@@ -460,36 +682,51 @@ class UIManager:
 
     def render_game(self, game_state, all_sprites=None, hero=None, enemy=None):
         if game_state == GameState.CHARACTER_SELECT:
-            self._draw_character_selection_scene()
-        elif game_state == GameState.BATTLE_MODE:
-            self._draw_battle_scene(all_sprites, hero, enemy)
-        pygame.display.flip()
-
-    def _draw_character_selection_scene(self):
-        self.screen.blit(self.bg_selection, (0, 0))
-        txt = self.font.render("SELECT YOUR CHARACTER:", True, (0, 0, 0))
-        self.screen.blit(txt, txt.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery - 150)))
+            background, blits = self.bg_selection, self._character_selection_blits()
+        elif game_state == GameState.BATTLE_MODE and self.background:
+            background, blits = self.background, self._battle_blits(all_sprites, hero, enemy)
+        else:
+            pygame.display.flip()
+            return
+
+        if self.show_profiler:
+            blits.append(self._profiler_blit())
+
+        if self.dirty_rendering:
+            self.renderer.render(background, blits)
+        else:
+            self.screen.blit(background, (0, 0))
+            self.screen.blits(blits, False)
+            with self.profiler.phase("present"):
+                pygame.display.flip()
+
+    def _profiler_blit(self):
+        if self._profiler_text is None or self.profiler.frames % self.PROFILER_REFRESH == 0:
+            self._profiler_text = AssetsManager.render_text(None, 22, self.profiler.overlay_text(), (255, 255, 255))
+        return self._profiler_text, self._profiler_text.get_rect(topleft=(8, 8))
+
+    def _character_selection_blits(self):
+        blits = [(self.title_text, self.title_rect)]
         for card in self.character_cards:
-            card.draw(self.screen)
+            blits.extend(card.blits())
+        return blits
 
     def update(self):
         self.attack_button.update()
         self.special_ability_button.update()
 
-    def _draw_battle_scene(self, all_sprites, hero, enemy):
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-            self.attack_button.draw(self.screen)
-            self.special_ability_button.draw(self.screen)
+    def _battle_blits(self, all_sprites, hero, enemy):
+        blits = self.attack_button.blits() + self.special_ability_button.blits()
 
-            if all_sprites:
-                all_sprites.draw(self.screen)
+        if all_sprites:
+            blits.extend((sprite.image, sprite.rect) for sprite in all_sprites)
 
-            if hero:
-                hero.draw_hp_bar(self.screen)
+        if hero:
+            blits.extend(hero.hp_bar_blits())
 
-            if enemy:
-                enemy.draw_hp_bar(self.screen)
+        if enemy:
+            blits.extend(enemy.hp_bar_blits())
 
-            for card in self.inventory_cards:
-                card.draw(self.screen)
\ No newline at end of file
+        for card in self.inventory_cards:
+            blits.extend(card.blits())
+        return blits
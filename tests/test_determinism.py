@@ -0,0 +1,69 @@
+import json
+import os
+
+import pytest
+
+from batch_engine import BatchBattle, HERO_WINS, MONSTER_WINS, NO_WINNER
+from factory import GameFactory
+from rng import BattleRng
+from simulator import BattleSimulator
+from project.tournament import Tournament
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WINNERS = {"hero": HERO_WINS, "monster": MONSTER_WINS, None: NO_WINNER}
+
+def load(name):
+    with open(os.path.join(ROOT, "data", name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+CHARACTERS = load("characters.json")
+MONSTERS = load("monsters.json")
+WEAPONS = load("weapons.json")
+
+def build(hero_data, monster_data, level=1):
+    hero = GameFactory.create_character(hero_data)
+    weapon = next((w for w in WEAPONS if w["name"] == hero_data.get("default_weapon")), None)
+    if weapon is not None:
+        hero.equip(GameFactory.create_weapon(weapon))
+    return hero, GameFactory.create_monster(monster_data, level)
+
+def as_tuple(result, i=None):
+    if i is None:
+        return WINNERS[result.winner], result.rounds, result.hero_hp, result.monster_hp
+    return int(result.winner[i]), int(result.rounds[i]), int(result.hero_hp[i]), int(result.monster_hp[i])
+
+@pytest.mark.parametrize("hero_data", CHARACTERS, ids=lambda d: d["class"])
+@pytest.mark.parametrize("monster_data", MONSTERS, ids=lambda d: d["class"])
+def test_object_and_batch_replay_the_same_battles(hero_data, monster_data):
+    hero, monster = build(hero_data, monster_data, level=2)
+    objects = BattleSimulator().run_many(hero, monster, 50, seed="replay")
+    hero.reset()
+    monster.reset()
+    batch = BatchBattle.repeat(hero, monster, 50, seed="replay").run()
+    assert [as_tuple(r) for r in objects] == [as_tuple(batch, i) for i in range(len(batch))]
+
+def test_one_seeded_battle_matches_in_every_mode():
+    hero_data, monster_data = CHARACTERS[0], MONSTERS[0]
+    tournament = Tournament([hero_data], WEAPONS, [monster_data], levels=1, battles=1, workers=1, seed=7)
+    seed = tournament.matchup_seed(0, 0, 1)
+
+    hero, monster = build(hero_data, monster_data)
+    single = BattleSimulator().run(hero, monster, BattleRng(seed).stream(0))
+    hero.reset()
+    monster.reset()
+    batch = BatchBattle.repeat(hero, monster, 1, seed=seed).run()
+    stats = tournament.run()[(hero_data["name"], monster_data["name"], 1)]
+
+    assert as_tuple(single) == as_tuple(batch, 0)
+    assert stats.hero_wins == (single.winner == "hero")
+    assert stats.kill_rounds == (single.rounds if single.winner == "hero" else 0)
+
+def test_tournament_shards_do_not_change_results():
+    hero_data, monster_data = CHARACTERS[2], MONSTERS[0]
+    tournament = Tournament([hero_data], WEAPONS, [monster_data], levels=1, battles=40, shard_size=7, workers=2, seed=3)
+    stats = tournament.run()[(hero_data["name"], monster_data["name"], 1)]
+
+    hero, monster = build(hero_data, monster_data)
+    objects = BattleSimulator().run_many(hero, monster, 40, seed=tournament.matchup_seed(0, 0, 1))
+    assert stats.hero_wins == sum(r.winner == "hero" for r in objects)
+    assert stats.kill_rounds == sum(r.rounds for r in objects if r.winner == "hero")